@@ -118,6 +118,30 @@ def _update_prediction_result(date: str, match_id: str, is_win: bool, profit: fl
         print(f"[DB ERROR] _update_prediction_result on match {match_id}: {e}")
 
 
+def _result_profit(row: dict, actual_winner: str) -> tuple:
+    """(is_win, profit) de una predicción dado el ganador real."""
+    kelly_stake = row.get('kelly_stake') or 0
+    odds_american = row.get('odds')
+    predicted_winner = row.get('predicted_winner')
+    odds_home = row.get('odds_home')
+    odds_away = row.get('odds_away')
+    home_team = row.get('home_team')
+    
+    is_win = (predicted_winner == actual_winner)
+    
+    profit = 0
+    if is_win:
+        decimal_odds = odds_home if predicted_winner == home_team else odds_away
+        if decimal_odds and decimal_odds > 1:
+            profit = kelly_stake * (decimal_odds - 1)
+        elif odds_american:
+            am = float(odds_american)
+            profit = kelly_stake * (am / 100) if am > 0 else kelly_stake * (100 / abs(am))
+    else:
+        profit = -kelly_stake
+    return is_win, profit
+
+
 def update_results(date: str, results: dict):
     """Actualiza resultados reales y calcula profit."""
     client = _get_supabase()
@@ -130,32 +154,53 @@ def update_results(date: str, results: dict):
             if not res.data:
                 continue
             
-            row = res.data[0]
-            kelly_stake = row.get('kelly_stake') or 0
-            odds_american = row.get('odds')
-            predicted_winner = row.get('predicted_winner')
-            odds_home = row.get('odds_home')
-            odds_away = row.get('odds_away')
-            home_team = row.get('home_team')
-            
-            is_win = (predicted_winner == actual_winner)
-            
-            profit = 0
-            if is_win:
-                decimal_odds = odds_home if predicted_winner == home_team else odds_away
-                if decimal_odds and decimal_odds > 1:
-                    profit = kelly_stake * (decimal_odds - 1)
-                elif odds_american:
-                    am = float(odds_american)
-                    profit = kelly_stake * (am / 100) if am > 0 else kelly_stake * (100 / abs(am))
-            else:
-                profit = -kelly_stake
-                
+            is_win, profit = _result_profit(res.data[0], actual_winner)
             _update_prediction_result(date, match_id, is_win, profit)
         except Exception as e:
             print(f"[DB ERROR] update_results on match {match_id}: {e}")
 
 
+# match_ids por consulta IN (mantiene la URL de PostgREST acotada)
+BULK_CHUNK_SIZE = 200
+
+def update_results_bulk(results: list):
+    """
+    Igual que update_results pero para (date, match_id, actual_winner) de varias fechas:
+    un select por bloque y un UPDATE por cada (date, result, profit) distinto
+    en lugar de dos peticiones por partido.
+    """
+    client = _get_supabase()
+    if not client or not results: return
+
+    winners = {(d, m): w for d, m, w in results}
+    match_ids = list({m for _, m, _ in results})
+    
+    for i in range(0, len(match_ids), BULK_CHUNK_SIZE):
+        chunk = match_ids[i:i + BULK_CHUNK_SIZE]
+        try:
+            res = client.table('predictions').select('date, match_id, kelly_stake, odds, predicted_winner, odds_home, odds_away, home_team').in_('match_id', chunk).execute()
+            
+            # Partidos con el mismo resultado comparten un UPDATE
+            groups = {}
+            for row in res.data:
+                actual_winner = winners.get((row.get('date'), row.get('match_id')))
+                if actual_winner is None:
+                    continue
+                is_win, profit = _result_profit(row, actual_winner)
+                key = (row['date'], 'WIN' if is_win else 'LOSS', profit)
+                groups.setdefault(key, []).append(row['match_id'])
+            
+            # UPDATE y no upsert: solo toca filas existentes (un INSERT ... ON CONFLICT
+            # valida NOT NULL en la fila nueva y recrearía predicciones borradas)
+            for (date, result_str, profit), ids in groups.items():
+                client.table('predictions').update({
+                    'result': result_str,
+                    'profit': profit
+                }).eq('date', date).in_('match_id', ids).execute()
+        except Exception as e:
+            print(f"[DB ERROR] update_results_bulk on {len(chunk)} matches: {e}")
+
+
 def delete_football_history():
     """Borra todo el historial de predicciones de fútbol."""
     client = _get_supabase()
@@ -10,6 +10,8 @@ El trabajo pesado se movi├│ a GitHub Actions (generate_daily_job.py).
 import os
 import sys
 import asyncio
+import hashlib
+import json
 import threading
 from datetime import datetime, timezone, timedelta
 from typing import Optional
@@ -18,6 +20,7 @@ from typing import Optional
 TZ_COLOMBIA = timezone(timedelta(hours=-5))
 
 from fastapi import FastAPI, BackgroundTasks, HTTPException, Request, Depends
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, Response
@@ -641,8 +644,23 @@ async def admin_force_correct(_: None = Depends(require_admin)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _etag_response(request: Request, payload) -> Response:
+    """
+    JSON response with an ETag over its body. Dashboards re-poll the history
+    endpoints constantly; when nothing changed they get an empty 304 instead
+    of the full payload again.
+    """
+    # Bandwidth only, not a server-side cache: the caller has already run the
+    # full Supabase query and the ETag is hashed from the finished body
+    body = json.dumps(jsonable_encoder(payload), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    etag = f'"{hashlib.md5(body).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
 @app.get("/history/full")
-async def get_full_history(background_tasks: BackgroundTasks, days: int = 365):
+async def get_full_history(request: Request, background_tasks: BackgroundTasks, days: int = 365):
     """Obtiene el historial NBA de los ├║ltimos d├¡as. Dispara actualizaci├│n de marcadores en background."""
     # Actualizar partidos pendientes solo si no se ha corrido recientemente (throttle)
     now = datetime.now(timezone.utc)
@@ -651,12 +669,12 @@ async def get_full_history(background_tasks: BackgroundTasks, days: int = 365):
     data = history_db.get_history(days)
     # El frontend espera { history: [...] }
     if isinstance(data, list):
-        return {"history": data}
+        return _etag_response(request, {"history": data})
     return data
 
 
 @app.get("/history/football")
-async def get_football_history_endpoint(days: int = 30):
+async def get_football_history_endpoint(request: Request, days: int = 30):
     """Obtiene el historial de f├║tbol de los ├║ltimos d├¡as."""
     import traceback, logging
     logger = logging.getLogger(__name__)
@@ -676,7 +694,7 @@ async def get_football_history_endpoint(days: int = 30):
             except Exception as logo_err:
                 logger.warning(f"football_logos enrichment failed (non-fatal): {logo_err}")
 
-            return {"history": data}
+            return _etag_response(request, {"history": data})
         return data
     except Exception as e:
         tb = traceback.format_exc()
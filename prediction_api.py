@@ -27,6 +27,11 @@ BASE_DIR = Path(__file__).resolve().parent
 MODEL_DIR = BASE_DIR / "Models" / "XGBoost_Models"
 TEAM_DB_PATH = BASE_DIR / "Data" / "TeamData.sqlite"
 ACCURACY_PATTERN = re.compile(r"XGBoost_(\d+(?:\.\d+)?)%_")
+# Newest snapshot strictly before a date, via the snapshot_index table kept by Get_Data
+SNAPSHOT_INDEX_QUERY = (
+    "SELECT table_name, snapshot_date FROM snapshot_index "
+    "WHERE snapshot_date < ? ORDER BY snapshot_date DESC LIMIT 1"
+)
 
 # Drop columns when building features (same as training)
 DROP_COLUMNS = [
@@ -127,6 +132,31 @@ def _get_available_table_dates(team_db_path: Path = TEAM_DB_PATH) -> list:
         return []
 
 
+def _lookup_snapshot_index(con: sqlite3.Connection, target_date: date) -> Optional[tuple[str, date]]:
+    """
+    Primary-key range lookup of the newest snapshot before target_date.
+    Returns None when the DB has no (or an empty) snapshot_index, so the
+    caller falls back to scanning sqlite_master.
+    """
+    try:
+        row = con.execute(SNAPSHOT_INDEX_QUERY, (target_date.isoformat(),)).fetchone()
+        earliest = None
+        if row is None:
+            earliest = con.execute("SELECT MIN(snapshot_date) FROM snapshot_index").fetchone()[0]
+    except sqlite3.OperationalError:
+        return None
+    
+    if row is not None:
+        return row[0], date.fromisoformat(row[1])
+    if earliest is None:
+        return None
+    print(f"[ERROR] No valid snapshots before {target_date}.")
+    raise DataLeakageError(
+        f"No team data available before {target_date}. "
+        f"Earliest available: {earliest}"
+    )
+
+
 def _resolve_table_for_date(
     target_date: date,
     team_db_path: Path = TEAM_DB_PATH
@@ -151,15 +181,21 @@ def _resolve_table_for_date(
         print(f"[POINT-IN-TIME] Resolving table for game date: {target_date}")
         
         with sqlite3.connect(team_db_path) as con:
-            cursor = con.execute("SELECT name FROM sqlite_master WHERE type='table'")
+            indexed = _lookup_snapshot_index(con, target_date)
             tables = []
-            for (name,) in cursor.fetchall():
-                try:
-                    table_date = pd.to_datetime(name).date()
-                    tables.append((name, table_date))
-                except ValueError:
-                    continue
-            
+            if indexed is None:
+                # No snapshot_index yet: scan every table name
+                cursor = con.execute("SELECT name FROM sqlite_master WHERE type='table'")
+                for (name,) in cursor.fetchall():
+                    try:
+                        table_date = pd.to_datetime(name).date()
+                        tables.append((name, table_date))
+                    except ValueError:
+                        continue
+        
+        if indexed is not None:
+            selected_table, selected_date = indexed
+        else:
             if not tables:
                 print("[ERROR] No team data tables found in TeamData.sqlite")
                 return None, None
@@ -179,18 +215,18 @@ def _resolve_table_for_date(
             valid_tables.sort(key=lambda x: x[1], reverse=True)
             selected_table, selected_date = valid_tables[0]
             
-            data_age_days = (target_date - selected_date).days
-            print(f"[POINT-IN-TIME] ✓ Using snapshot: {selected_date} (age: {data_age_days}d)")
-            
-            if data_age_days > 3:
-                print(f"[WARNING] Data is {data_age_days} days old!")
-            
-            # Cache only the table name, NOT the data
-            _team_data_cache["table_name"] = selected_table
-            _team_data_cache["data_date"] = selected_date
-            _team_data_cache["target_date"] = target_date
-            
-            return selected_table, selected_date
+        data_age_days = (target_date - selected_date).days
+        print(f"[POINT-IN-TIME] ✓ Using snapshot: {selected_date} (age: {data_age_days}d)")
+        
+        if data_age_days > 3:
+            print(f"[WARNING] Data is {data_age_days} days old!")
+        
+        # Cache only the table name, NOT the data
+        _team_data_cache["table_name"] = selected_table
+        _team_data_cache["data_date"] = selected_date
+        _team_data_cache["target_date"] = target_date
+        
+        return selected_table, selected_date
             
     except DataLeakageError:
         raise
@@ -398,12 +434,12 @@ def predict_game(
         "bet_analysis": {
             "home": {
                 "decision": home_decision.decision if home_decision else "N/A",
-                "stake_units": home_decision.stake_units if home_decision else 0,
+                "stake_units": round(home_decision.stake_units, 4) if home_decision else 0,
                 "reason": home_decision.reason if home_decision else ""
             },
             "away": {
                 "decision": away_decision.decision if away_decision else "N/A",
-                "stake_units": away_decision.stake_units if away_decision else 0,
+                "stake_units": round(away_decision.stake_units, 4) if away_decision else 0,
                 "reason": away_decision.reason if away_decision else ""
             }
         }
@@ -1,11 +1,27 @@
 import sqlite3
 import os
+import uuid
+from contextlib import closing, contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Literal
+from typing import List, Optional, Literal
 
 from .models import BankrollState, Transaction, TransactionType
 
+def _ledger_entry(result: str, stake_units: float, profit_units: float = 0.0, note: Optional[str] = None, expected_value: float = 0.0):
+    """(tx_type, change, note, expected_value) for one bet result."""
+    result = result.upper()
+    if result not in ["WIN", "LOSS", "PUSH"]:
+        raise ValueError(f"Invalid result: {result}")
+    
+    if result == "WIN":
+        return TransactionType.BET_WIN.value, profit_units, note, expected_value
+    if result == "LOSS":
+        return TransactionType.BET_LOSS.value, -stake_units, note, expected_value
+    # PUSH
+    note = f"PUSH - {note}" if note else "PUSH"
+    return TransactionType.ADJUSTMENT.value, 0.0, note, expected_value
+
 class BankrollManager:
     """
     Decoupled Financial State Manager.
@@ -16,26 +32,77 @@ class BankrollManager:
     3. Transactional (ledger for all changes)
     """
     
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(self, db_path: Optional[str] = None, pragmas: Optional[dict] = None,
+                 connection: Optional[sqlite3.Connection] = None):
+        # A caller-owned connection replaces the per-call connections; each
+        # operation then runs as a SAVEPOINT inside the caller's transaction
+        self._shared_con = connection
         if db_path is None:
             # Default to Data/Bankroll.sqlite relative to project root
             base_dir = Path(__file__).resolve().parents[2]
             db_path = base_dir / "Data" / "Bankroll.sqlite"
         
-        self.db_path = Path(db_path)
+        # In-memory databases (":memory:" or a "file:...?mode=memory" URI) are opened
+        # as a named shared-cache DB so every connection sees the same data
+        if db_path == ":memory:":
+            db_path = f"file:bankroll_{uuid.uuid4().hex}?mode=memory&cache=shared"
+        self._uri = str(db_path).startswith("file:")
+        self.db_path = str(db_path) if self._uri else Path(db_path)
+        # Applied to every connection, e.g. {"synchronous": "OFF"} for throwaway test DBs
+        self._pragma_script = "".join(f"PRAGMA {name}={value};" for name, value in (pragmas or {}).items())
+        
+        # SQLite drops a shared-cache memory DB when its last connection closes,
+        # so one stays open for the manager's lifetime
+        self._keepalive = (
+            self._connect() if connection is None and self._uri and "mode=memory" in self.db_path else None
+        )
         self._init_db()
 
+    def _connect(self) -> sqlite3.Connection:
+        con = sqlite3.connect(self.db_path, uri=self._uri)
+        if self._pragma_script:
+            con.executescript(self._pragma_script)
+        return con
+
+    @contextmanager
+    def _session(self):
+        """
+        Connection for one operation: committed on success, rolled back on error.
+        On a caller-owned connection the operation is a SAVEPOINT, so it nests in
+        (and is undone by rolling back) whatever transaction the caller holds.
+        """
+        if self._shared_con is None:
+            with self._connect() as con:
+                yield con
+            return
+        
+        con = self._shared_con
+        con.execute("SAVEPOINT bankroll_op")
+        try:
+            yield con
+        except BaseException:
+            con.execute("ROLLBACK TO bankroll_op")
+            con.execute("RELEASE bankroll_op")
+            raise
+        con.execute("RELEASE bankroll_op")
+
     def _init_db(self):
         """Initialize database schema if not exists."""
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        if self._shared_con is None and not self._uri:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
         schema_path = Path(__file__).parent / "schema.sql"
         with open(schema_path, "r") as f:
             schema_script = f.read()
+        
+        # executescript commits first, so the DDL runs outside any savepoint
+        if self._shared_con is not None:
+            self._shared_con.executescript(schema_script)
+        else:
+            with closing(self._connect()) as con:
+                con.executescript(schema_script)
             
-        with sqlite3.connect(self.db_path) as con:
-            con.executescript(schema_script)
-            
+        with self._session() as con:
             # Ensure singleton row exists
             cursor = con.execute("SELECT COUNT(*) FROM bankroll_state")
             if cursor.fetchone()[0] == 0:
@@ -46,7 +113,7 @@ class BankrollManager:
 
     def reset(self, initial_units: float = 100.0):
         """Hard reset of the bankroll."""
-        with sqlite3.connect(self.db_path) as con:
+        with self._session() as con:
             # Clear transactions
             con.execute("DELETE FROM transactions")
             
@@ -71,10 +138,11 @@ class BankrollManager:
 
     def get_state(self) -> BankrollState:
         """Get current financial metrics."""
-        with sqlite3.connect(self.db_path) as con:
+        with self._session() as con:
             # Use row factory to dict for Pydantic
-            con.row_factory = sqlite3.Row
-            row = con.execute("SELECT * FROM bankroll_state WHERE id = 1").fetchone()
+            cursor = con.cursor()
+            cursor.row_factory = sqlite3.Row
+            row = cursor.execute("SELECT * FROM bankroll_state WHERE id = 1").fetchone()
             return BankrollState(**dict(row))
 
     def update_bankroll(self, result: Literal["WIN", "LOSS", "PUSH"], stake_units: float, profit_units: float = 0.0, note: Optional[str] = None, expected_value: float = 0.0):
@@ -88,32 +156,39 @@ class BankrollManager:
             note: Context (e.g., game ID)
             expected_value: The EV of the bet (e.g. 0.05 for 5%)
         """
-        result = result.upper()
-        if result not in ["WIN", "LOSS", "PUSH"]:
-            raise ValueError(f"Invalid result: {result}")
-            
-        with sqlite3.connect(self.db_path) as con:
+        return self.update_bankroll_batch([(result, stake_units, profit_units, note, expected_value)])
+
+    def update_bankroll_batch(self, results: List[tuple]) -> float:
+        """
+        Apply several bet results in a single transaction.
+        
+        Each item holds update_bankroll's arguments in order:
+        (result, stake_units[, profit_units[, note[, expected_value]]]).
+        Peak and drawdown are tracked through the whole sequence, then the state
+        row is written once and the ledger rows with one executemany.
+        
+        Returns the balance after the last result.
+        """
+        # Validate everything before touching the DB
+        entries = [_ledger_entry(*item) for item in results]
+        
+        with self._session() as con:
             state = self.get_state()
-            current = state.current_units
+            balance = state.current_units
+            if not entries:
+                return balance
             peak = state.peak_units
+            max_drawdown = state.max_drawdown
             
-            if result == "WIN":
-                change = profit_units
-                tx_type = TransactionType.BET_WIN.value
-            elif result == "LOSS":
-                change = -stake_units
-                tx_type = TransactionType.BET_LOSS.value
-            else: # PUSH
-                change = 0.0
-                tx_type = TransactionType.ADJUSTMENT.value
-                note = f"PUSH - {note}" if note else "PUSH"
-
-            new_balance = current + change
-            
-            # Update metrics
-            new_peak = max(peak, new_balance)
-            current_drawdown = (new_peak - new_balance) / new_peak if new_peak > 0 else 0.0
-            new_max_drawdown = max(state.max_drawdown, current_drawdown)
+            ledger = []
+            for tx_type, change, note, expected_value in entries:
+                balance += change
+                
+                # Update metrics
+                peak = max(peak, balance)
+                current_drawdown = (peak - balance) / peak if peak > 0 else 0.0
+                max_drawdown = max(max_drawdown, current_drawdown)
+                ledger.append((tx_type, change, balance, note, expected_value))
 
             # DB Update
             con.execute("""
@@ -123,20 +198,21 @@ class BankrollManager:
                     max_drawdown = ?,
                     last_updated = CURRENT_TIMESTAMP
                 WHERE id = 1
-            """, (new_balance, new_peak, new_max_drawdown))
+            """, (balance, peak, max_drawdown))
             
-            con.execute("""
+            con.executemany("""
                 INSERT INTO transactions (type, amount, balance_after, note, expected_value)
                 VALUES (?, ?, ?, ?, ?)
-            """, (tx_type, change, new_balance, note, expected_value))
+            """, ledger)
             
-            return new_balance
+            return balance
 
     def calculate_performance(self):
         """Calculate aggregate performance metrics from transactions."""
-        with sqlite3.connect(self.db_path) as con:
-            con.row_factory = sqlite3.Row
-            rows = con.execute("SELECT * FROM transactions WHERE type IN ('BET_WIN', 'BET_LOSS')").fetchall()
+        with self._session() as con:
+            cursor = con.cursor()
+            cursor.row_factory = sqlite3.Row
+            rows = cursor.execute("SELECT * FROM transactions WHERE type IN ('BET_WIN', 'BET_LOSS')").fetchall()
             
             state = self.get_state()
             
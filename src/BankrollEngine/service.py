@@ -1,7 +1,8 @@
 import sqlite3
 import threading
+import uuid
 from pathlib import Path
-from typing import Optional, Literal
+from typing import List, Optional, Literal
 import logging
 
 from .models import BankrollState, TransactionType
@@ -10,12 +11,20 @@ from .models import BankrollState, TransactionType
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("BankrollService")
 
+def _bet_result(result: str, stake_units: float, profit_units: float = 0.0, note: Optional[str] = None, expected_value: float = 0.0):
+    """update_bankroll's arguments as a full tuple, defaults filled in."""
+    return result.upper(), stake_units, profit_units, note, expected_value
+
+# Kelly fraction the state machine assigns on entering each status
+_KELLY_BY_STATUS = {"ACTIVE": 0.25, "DEGRADED": 0.10, "PAUSED": 0.0}
+
 class BankrollService:
     """
     Singleton Service for Centralized Bankroll Management.
     Implements State Machine for Risk Control (Active -> Degraded -> Paused).
     Thread-safe database access.
     """
+    __slots__ = ("db_path", "_uri", "_in_memory", "_keepalive", "_status_cache", "_initialized")
     _instance = None
     _lock = threading.Lock()
     
@@ -35,14 +44,62 @@ class BankrollService:
             base_dir = Path(__file__).resolve().parents[2]
             db_path = base_dir / "Data" / "Bankroll.sqlite"
         
-        self.db_path = Path(db_path)
+        # ":memory:" becomes a named shared-cache DB so every connection sees the
+        # same data; one connection is held open since SQLite drops the DB when
+        # its last connection closes
+        if db_path == ":memory:":
+            db_path = f"file:bankroll_service_{uuid.uuid4().hex}?mode=memory&cache=shared"
+        self._uri = str(db_path).startswith("file:")
+        self.db_path = str(db_path) if self._uri else Path(db_path)
+        self._in_memory = self._uri and "mode=memory" in self.db_path
+        self._keepalive = self.connect() if self._in_memory else None
+        # Last status read or written by this process; None until the first read
+        self._status_cache: Optional[str] = None
         self._init_db()
         self._initialized = True
         logger.info(f"BankrollService initialized at {self.db_path}")
 
+    @classmethod
+    def reset_for_testing(cls, db_path) -> "BankrollService":
+        """
+        Rebind the singleton to another database, for tests and verify scripts.
+        
+        The instance is re-initialised in place, so services already holding it
+        (RiskGuard, BetPipeline) follow it to the new DB. A memory DB held open
+        by the previous binding is released; rebinding to that same memory DB
+        keeps it, skipping the schema script and seed row it already has.
+        """
+        svc = cls.__new__(cls)
+        if svc._initialized and svc._in_memory and str(db_path) == svc.db_path:
+            svc._status_cache = None
+            return svc
+        keepalive = getattr(svc, "_keepalive", None)
+        if keepalive is not None:
+            keepalive.close()
+        svc._initialized = False
+        svc.__init__(db_path=db_path)
+        return svc
+
+    def connect(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        """
+        New connection to the bankroll DB (a path or a "file:" URI). Pass
+        check_same_thread=False for a connection shared across threads; the
+        caller then serialises access to it.
+        """
+        con = sqlite3.connect(self.db_path, uri=self._uri, check_same_thread=check_same_thread)
+        if not self._in_memory:
+            # NORMAL is only crash-safe in WAL mode; rollback-journal files
+            # (DBs created before WAL was enabled) keep the FULL default
+            journal_mode = con.execute("PRAGMA journal_mode").fetchone()[0]
+            if journal_mode == "wal":
+                con.execute("PRAGMA synchronous=NORMAL")
+        return con
+
     def _init_db(self):
         """Initialize database schema if not exists."""
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        new_file = not self._uri and not self.db_path.exists()
+        if not self._uri:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
         schema_path = Path(__file__).parent / "schema.sql"
         if not schema_path.exists():
@@ -51,35 +108,43 @@ class BankrollService:
         with open(schema_path, "r") as f:
             schema_script = f.read()
             
-        with sqlite3.connect(self.db_path) as con:
+        with self.connect() as con:
+            if new_file:
+                # Persistent per file. An existing DB keeps its mode until the
+                # AuditLogger, which always opens it in WAL, first starts
+                con.execute("PRAGMA journal_mode=WAL")
             con.executescript(schema_script)
             
+            # Older DBs named the peak column peak_bankroll
+            columns = {r[1] for r in con.execute("PRAGMA table_info(bankroll_state)")}
+            if "peak_units" not in columns and "peak_bankroll" in columns:
+                con.execute("ALTER TABLE bankroll_state RENAME COLUMN peak_bankroll TO peak_units")
+                logger.info("Renamed bankroll_state.peak_bankroll to peak_units")
+            
             # Ensure singleton row exists
             cursor = con.execute("SELECT COUNT(*) FROM bankroll_state")
             if cursor.fetchone()[0] == 0:
                 con.execute("""
-                    INSERT INTO bankroll_state (id, current_units, initial_units, peak_bankroll, max_drawdown, kelly_fraction, status)
+                    INSERT INTO bankroll_state (id, current_units, initial_units, peak_units, max_drawdown, kelly_fraction, status)
                     VALUES (1, 100.0, 100.0, 100.0, 0.0, 0.25, 'ACTIVE')
                 """)
 
     def get_state(self) -> BankrollState:
         """Get current financial metrics and status."""
-        with sqlite3.connect(self.db_path) as con:
+        with self.connect() as con:
             con.row_factory = sqlite3.Row
             row = con.execute("SELECT * FROM bankroll_state WHERE id = 1").fetchone()
             if not row:
                 raise RuntimeError("Bankroll state missing!")
-            return BankrollState(**dict(row))
+            state = BankrollState(**dict(row))
+        self._status_cache = state.status
+        return state
 
-    def _update_status(self, current_drawdown: float, consecutive_losses: int) -> tuple[str, float]:
+    def _update_status(self, current_drawdown: float, consecutive_losses: int, status: str, kelly: float) -> tuple[str, float]:
         """
         State Machine Logic.
-        Returns (new_status, new_kelly_fraction)
+        Returns (new_status, new_kelly_fraction) given the current status and Kelly fraction.
         """
-        current_state = self.get_state()
-        status = current_state.status
-        kelly = current_state.kelly_fraction
-        
         # 1. Check for Critical Failure (Pause)
         if consecutive_losses >= 10:
             return "PAUSED", 0.0
@@ -118,66 +183,119 @@ class BankrollService:
         """
         Transactional update of bankroll with State Machine evaluation.
         """
+        return self.update_bankroll_batch([(result, stake_units, profit_units, note, expected_value)])
+
+    def update_bankroll_batch(self, results: List[tuple]) -> float:
+        """
+        Apply several bet results in one transaction.
+        
+        Each item holds update_bankroll's arguments in order:
+        (result, stake_units[, profit_units[, note[, expected_value]]]).
+        The state machine is stepped after every result exactly as with
+        sequential update_bankroll calls (results after a PAUSE are ignored),
+        but the ledger is written with one executemany and the state row once.
+        
+        Returns the balance after the last applied result.
+        """
         # Fail-safe: Check status first (in memory/read)
         state = self.get_state()
         if state.status == "PAUSED":
             logger.warning("Attempted update while PAUSED. Ignoring.")
             return state.current_units
-
-        result = result.upper()
         
-        with sqlite3.connect(self.db_path) as con:
+        with self.connect() as con:
             con.row_factory = sqlite3.Row  # Ensure index-based access works
             # Re-read inside transaction for consistency
             row = con.execute("SELECT * FROM bankroll_state WHERE id = 1").fetchone()
-            current = row['current_units']
-            peak = row['peak_bankroll']
+            balance = row['current_units']
+            peak = row['peak_units']
             max_dd = row['max_drawdown']
+            status = state.status
+            kelly = state.kelly_fraction
+            losses = self._count_consecutive_losses(con)
             
-            # 1. Application Logic
-            if result == "WIN":
-                change = profit_units
-                tx_type = TransactionType.BET_WIN.value
-            elif result == "LOSS":
-                change = -stake_units
-                tx_type = TransactionType.BET_LOSS.value
-            else: # PUSH
-                change = 0.0
-                tx_type = TransactionType.ADJUSTMENT.value
-            
-            new_balance = current + change
-            
-            # 2. Metrics Update
-            new_peak = max(peak, new_balance)
-            current_drawdown = (new_peak - new_balance) / new_peak if new_peak > 0 else 0.0
-            new_max_drawdown = max(max_dd, current_drawdown)
+            ledger = []
+            for i, item in enumerate(results):
+                if status == "PAUSED":
+                    logger.warning(f"Paused mid-batch. Ignoring the remaining {len(results) - i} result(s).")
+                    break
+                result, stake_units, profit_units, note, expected_value = _bet_result(*item)
+                
+                # 1. Application Logic
+                if result == "WIN":
+                    change = profit_units
+                    tx_type = TransactionType.BET_WIN.value
+                    losses = 0
+                elif result == "LOSS":
+                    change = -stake_units
+                    tx_type = TransactionType.BET_LOSS.value
+                    losses += 1
+                else: # PUSH
+                    change = 0.0
+                    tx_type = TransactionType.ADJUSTMENT.value
+                
+                balance += change
+                
+                # 2. Metrics Update
+                peak = max(peak, balance)
+                current_drawdown = (peak - balance) / peak if peak > 0 else 0.0
+                max_dd = max(max_dd, current_drawdown)
+                ledger.append((tx_type, change, balance, note, expected_value))
+                
+                # 3. State Machine Elevation
+                new_status, kelly = self._update_status(current_drawdown, losses, status, kelly)
+                if new_status != status:
+                    logger.warning(f"State Transition: {status} -> {new_status} (Kelly: {kelly})")
+                status = new_status
             
-            # Log Transaction first to allow counting losses
-            con.execute("""
+            # 4. Persistence
+            con.executemany("""
                 INSERT INTO transactions (type, amount, balance_after, note, expected_value)
                 VALUES (?, ?, ?, ?, ?)
-            """, (tx_type, change, new_balance, note, expected_value))
-            
-            # 3. State Machine Elevation
-            losses = self._count_consecutive_losses(con)
-            new_status, new_kelly = self._update_status(current_drawdown, losses)
-            
-            if new_status != state.status:
-                logger.warning(f"State Transition: {state.status} -> {new_status} (Kelly: {new_kelly})")
-
-            # 4. Persistence
+            """, ledger)
             con.execute("""
                 UPDATE bankroll_state
                 SET current_units = ?,
-                    peak_bankroll = ?,
+                    peak_units = ?,
                     max_drawdown = ?,
                     kelly_fraction = ?,
                     status = ?,
                     last_updated = CURRENT_TIMESTAMP
                 WHERE id = 1
-            """, (new_balance, new_peak, new_max_drawdown, new_kelly, new_status))
-            
-            return new_balance
+            """, (balance, peak, max_dd, kelly, status))
+        
+        self._status_cache = status
+        return balance
+
+    def force_status(self, status: Literal["ACTIVE", "DEGRADED", "PAUSED"]) -> None:
+        """
+        Test seam: put the state machine straight into `status` (with its Kelly
+        fraction) instead of replaying the results that would lead there.
+        Leaves a zero-amount TEST_SEAM ledger entry so the jump is auditable.
+        Only available on in-memory DBs, so it can never touch a real ledger.
+        """
+        if status not in _KELLY_BY_STATUS:
+            raise ValueError(f"Invalid status: {status}")
+        if not self._in_memory:
+            raise RuntimeError("force_status is a test seam; bind an in-memory DB with reset_for_testing(':memory:')")
+        
+        with self.connect() as con:
+            balance, old_status = con.execute(
+                "SELECT current_units, status FROM bankroll_state WHERE id = 1"
+            ).fetchone()
+            con.execute("""
+                INSERT INTO transactions (type, amount, balance_after, note)
+                VALUES (?, 0.0, ?, ?)
+            """, (TransactionType.ADJUSTMENT.value, balance, f"TEST_SEAM: status {old_status} -> {status}"))
+            con.execute("""
+                UPDATE bankroll_state
+                SET kelly_fraction = ?,
+                    status = ?,
+                    last_updated = CURRENT_TIMESTAMP
+                WHERE id = 1
+            """, (_KELLY_BY_STATUS[status], status))
+        self._status_cache = status
+        logger.warning(f"State forced: {old_status} -> {status}")
 
     @property
     def kelly_fraction(self) -> float:
@@ -185,13 +303,20 @@ class BankrollService:
 
     @property
     def operational_status(self) -> str:
-        return self.get_state().status
+        """
+        Current status without a DB round-trip. Every status change goes through
+        this service, which keeps the cached value current; only the first read
+        goes to SQLite.
+        """
+        if self._status_cache is None:
+            return self.get_state().status
+        return self._status_cache
 
     def get_observability_metrics(self) -> dict:
         """
         Get aggregated metrics for observability dashboard.
         """
-        with sqlite3.connect(self.db_path) as con:
+        with self.connect() as con:
             # Blocked Bets Count (from shadow or risk logs??)
             # RiskGuard blocks are "shadow" decisions usually if rejected?
             # Actually shadow_bettor logs ALL decisions.
@@ -217,7 +342,7 @@ class BankrollService:
                 "status": state.status,
                 "blocked_bets": blocked_count,
                 "avg_ev": avg_ev,
-                "peak_bankroll": state.peak_bankroll,
+                "peak_bankroll": state.peak_units,
                 "current_units": state.current_units
             }
 
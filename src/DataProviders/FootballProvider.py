@@ -1,13 +1,32 @@
+import re
 import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
 import logging
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+from src.DataProviders.aggregator import SESSION
+
+# Optional streaming JSON parser; falls back to response.json() when missing
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Splits DateUtc into (date, time) with one match instead of strptime + 2x strftime
+_DATE_UTC_RE = re.compile(r"(\d{4}-\d{2}-\d{2}) (\d{2}:\d{2}):\d{2}Z")
+
+# Conditional-GET cache: url -> (ETag, Last-Modified, parsed fixtures)
+_ETAG_CACHE: Dict[str, tuple] = {}
+
+def _copy_fixtures(fixtures: List[Dict]) -> List[Dict]:
+    """Fresh list and dicts, so callers can't mutate the cached fixtures."""
+    return [dict(f) for f in fixtures]
+
 class FootballProvider:
     """
     Provider for fetching live Football fixtures (Premier League).
@@ -52,7 +71,9 @@ class FootballProvider:
         "West Bromwich Albion": "West Brom"
     }
 
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
+        # Shared keep-alive pool by default; inject a session for tests or custom pooling
+        self.session = session or SESSION
         self.base_url = "https://fixturedownload.com/feed/json/epl-2025"
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
@@ -63,14 +84,15 @@ class FootballProvider:
         Normalizes team name to match strict format expected by the model.
         Returns the mapped name or the original if no map exists.
         """
-        # 1. Direct mapping
-        if name in self.TEAM_MAPPING:
-            return self.TEAM_MAPPING[name]
+        # 1. Direct mapping (aliases, stripped aliases and canonical names)
+        mapped = _NORMALIZED.get(name)
+        if mapped is not None:
+            return mapped
         
         # 2. Heuristics (optional cleanup)
         clean_name = name.strip()
         
-        return clean_name
+        return _NORMALIZED.get(clean_name, clean_name)
 
     def get_fixtures(self) -> List[Dict]:
         """
@@ -80,67 +102,101 @@ class FootballProvider:
         """
         try:
             logger.info(f"Fetching fixtures from {self.base_url}")
-            response = requests.get(self.base_url, headers=self.headers, timeout=10)
-            
-            if response.status_code != 200:
-                logger.error(f"Failed to fetch fixtures: Status {response.status_code}")
-                return []
+            etag, last_modified, cached = _ETAG_CACHE.get(self.base_url, (None, None, None))
+            headers = dict(self.headers)
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+            # Closed on every exit, early returns included, so streamed bodies free their socket
+            with self.session.get(self.base_url, headers=headers, timeout=10, stream=IJSON_AVAILABLE) as response:
+                if response.status_code == 304 and cached is not None:
+                    logger.info("Fixtures not modified since last fetch, reusing cached list")
+                    return _copy_fixtures(cached)
+
+                if response.status_code != 200:
+                    logger.error(f"Failed to fetch fixtures: Status {response.status_code}")
+                    return []
 
-            all_matches = response.json()
-            from datetime import datetime
+                if IJSON_AVAILABLE:
+                    # Decode matches one at a time straight off the socket
+                    response.raw.decode_content = True
+                    all_matches = ijson.items(response.raw, 'item')
+                else:
+                    all_matches = response.json()
             
-            # Find all pending matches (where score is None or not played yet)
-            pending_matches = [m for m in all_matches if m.get('HomeTeamScore') is None]
+                # Single pass: keep only pending matches (no score yet) of the lowest RoundNumber
+                next_round = None
+                matchday_fixtures = []
+                for m in all_matches:
+                    if m.get('HomeTeamScore') is not None:
+                        continue
+                    r = m['RoundNumber']
+                    if next_round is None or r < next_round:
+                        next_round = r
+                        matchday_fixtures = [m]
+                    elif r == next_round:
+                        matchday_fixtures.append(m)
             
-            if not pending_matches:
-                logger.info("No more pending matches found for this season.")
-                return []
+                if next_round is None:
+                    logger.info("No more pending matches found for this season.")
+                    return []
                 
-            # The next matchday is the lowest RoundNumber among pending matches
-            next_round = min(m['RoundNumber'] for m in pending_matches)
+                logger.info(f"Identified Next Matchday: Round {next_round} ({len(matchday_fixtures)} matches)")
             
-            # Filter matches belonging exclusively to exactly this matchday
-            matchday_fixtures = [m for m in pending_matches if m['RoundNumber'] == next_round]
-            logger.info(f"Identified Next Matchday: Round {next_round} ({len(matchday_fixtures)} matches)")
+                fixtures = []
+                _append = fixtures.append
+                # Fallback date for unparseable DateUtc values, computed once per fetch
+                _today = str(datetime.now().date())
             
-            fixtures = []
-            
-            for m in matchday_fixtures:
-                home_raw = m['HomeTeam']
-                away_raw = m['AwayTeam']
+                for m in matchday_fixtures:
+                    home_raw = m['HomeTeam']
+                    away_raw = m['AwayTeam']
                 
-                home_team = self.normalize_team_name(home_raw)
-                away_team = self.normalize_team_name(away_raw)
+                    home_team = self.normalize_team_name(home_raw)
+                    away_team = self.normalize_team_name(away_raw)
                 
-                # 'DateUtc': '2026-02-27 20:00:00Z'
-                raw_date = m.get('DateUtc', '')
-                try:
-                    # Parse to Python datetime to split correctly
-                    parsed_dt = datetime.strptime(raw_date, "%Y-%m-%d %H:%M:%SZ")
-                    match_date = parsed_dt.strftime("%Y-%m-%d")
-                    match_time = parsed_dt.strftime("%H:%M")
-                except Exception as e:
-                    logger.warning(f"Error parsing DateUtc '{raw_date}': {e}")
-                    match_date = str(datetime.now().date())
-                    match_time = "00:00"
+                    # 'DateUtc': '2026-02-27 20:00:00Z'
+                    raw_date = m.get('DateUtc') or ''
+                    date_match = _DATE_UTC_RE.fullmatch(raw_date)
+                    if date_match:
+                        match_date, match_time = date_match.groups()
+                    else:
+                        logger.warning(f"Error parsing DateUtc '{raw_date}'")
+                        match_date = _today
+                        match_time = "00:00"
                 
-                fixtures.append({
-                    "home_team": home_team,
-                    "away_team": away_team,
-                    "home_raw": home_raw,
-                    "away_raw": away_raw,
-                    "time": match_time,
-                    "date": match_date,
-                    "league": "ENG-Premier League",
-                    "round": next_round
-                })
+                    _append({
+                        "home_team": home_team,
+                        "away_team": away_team,
+                        "home_raw": home_raw,
+                        "away_raw": away_raw,
+                        "time": match_time,
+                        "date": match_date,
+                        "league": "ENG-Premier League",
+                        "round": next_round
+                    })
                 
-            return fixtures
+                _ETAG_CACHE[self.base_url] = (
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    fixtures,
+                )
+                return _copy_fixtures(fixtures)
 
         except Exception as e:
             logger.error(f"Error in get_fixtures: {e}")
             return []
 
+# Reverse lookup built once at import: alias -> canonical, stripped alias -> canonical,
+# canonical -> itself. Keeps normalize_team_name to a dict hit per fixture.
+_NORMALIZED: Dict[str, str] = {}
+for _alias, _canonical in FootballProvider.TEAM_MAPPING.items():
+    _NORMALIZED[_alias] = _canonical
+    _NORMALIZED[_alias.strip()] = _canonical
+    _NORMALIZED[_canonical] = _canonical
+del _alias, _canonical
+
 if __name__ == "__main__":
     # Test the provider
     provider = FootballProvider()
@@ -0,0 +1,19 @@
+"""
+Shared HTTP plumbing for data providers.
+One keep-alive Session and one thread pool, so provider requests
+overlap instead of running back-to-back.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+MAX_WORKERS = 8
+
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=16)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
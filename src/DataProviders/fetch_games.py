@@ -1,9 +1,21 @@
 import json
 import sys
 import os
+import tempfile
+import time
+
+# Short-lived on-disk cache so repeated polls skip the SBR scrape entirely.
+# 45s matches the sportsbook line-refresh cadence.
+CACHE_PATH = os.path.join(tempfile.gettempdir(), "sbr_nba.json")
+CACHE_TTL_SECONDS = 45
 
 # Add src to path if needed (but we use sbrscrape library)
 try:
+    if os.path.exists(CACHE_PATH) and time.time() - os.path.getmtime(CACHE_PATH) < CACHE_TTL_SECONDS:
+        with open(CACHE_PATH, "r", encoding="utf-8") as f:
+            print(f.read())
+        sys.exit(0)
+
     from sbrscrape import Scoreboard
     
     sb = Scoreboard(sport="NBA")
@@ -46,7 +58,23 @@ try:
             away_team_name: {'money_line_odds': money_line_away_value}
         }
             
-    print(json.dumps(dict_res))
+    output = json.dumps(dict_res)
+    # An empty board is usually a failed scrape; don't pin it for the TTL
+    if dict_res:
+        # Write a temp file then swap it in, so a concurrent poll never reads half a file
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(CACHE_PATH), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(output)
+            os.replace(tmp_path, CACHE_PATH)
+        except OSError as e:
+            # The cache is best-effort: warn on stderr and still print the board
+            print(f"WARNING: could not write cache {CACHE_PATH}: {e}", file=sys.stderr)
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    print(output)
     
 except Exception as e:
     # Print error to stderr so stdout remains clean or empty
@@ -1,7 +1,9 @@
-from typing import Dict, Any, Union
+from typing import Dict, Any, Union, Tuple, NamedTuple
+import numpy as np
 from pydantic import BaseModel, Field
 
-class EVResult(BaseModel):
+class EVResultModel(BaseModel):
+    """Validated EV payload for serialization boundaries (API responses)."""
     probability: float = Field(..., ge=0.0, le=1.0, description="Predicted probability of winning (0-1)")
     odds: float = Field(..., gt=1.0, description="Decimal odds offered by the market")
     ev: float = Field(..., description="Expected Value (percentage as decimal, e.g., 0.05 for 5%)")
@@ -10,6 +12,23 @@ class EVResult(BaseModel):
     def __str__(self):
         return f"EV: {self.ev:.2%} | Value: {self.is_value_bet} (Prob: {self.probability:.1%}, Odds: {self.odds:.2f})"
 
+class EVResult(NamedTuple):
+    """
+    Lightweight EV result used on the hot path.
+    Inputs are range-checked by calculate_ev, so no pydantic validation here.
+    """
+    probability: float
+    odds: float
+    ev: float
+    is_value_bet: bool
+
+    def __str__(self):
+        return f"EV: {self.ev:.2%} | Value: {self.is_value_bet} (Prob: {self.probability:.1%}, Odds: {self.odds:.2f})"
+
+    def to_model(self) -> EVResultModel:
+        """Convert to the validated pydantic model at an API boundary."""
+        return EVResultModel(**self._asdict())
+
 def calculate_ev(probability: float, odds: float) -> EVResult:
     """
     Calculate Expected Value (EV) for a single bet.
@@ -42,9 +61,23 @@ def calculate_ev(probability: float, odds: float) -> EVResult:
     
     is_value_bet = ev > 0
     
-    return EVResult(
-        probability=probability,
-        odds=odds,
-        ev=ev,
-        is_value_bet=is_value_bet
-    )
+    return EVResult(probability, odds, ev, is_value_bet)
+
+def calculate_ev_batch(probabilities: np.ndarray, odds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized EV for many bets at once (same formula as calculate_ev).
+    
+    Callers scanning many fixtures should filter on the returned mask first
+    and only build EVResult objects for the rows that are value bets.
+    
+    Args:
+        probabilities (np.ndarray): Predicted probabilities of winning (0 to 1).
+        odds (np.ndarray): Decimal odds, same shape as probabilities.
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (ev, value_mask) where value_mask is ev > 0.
+    """
+    p = np.asarray(probabilities, dtype=np.float64)
+    o = np.asarray(odds, dtype=np.float64)
+    ev = p * o - 1.0
+    return ev, ev > 0.0
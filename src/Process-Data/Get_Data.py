@@ -1,109 +1,221 @@
 import argparse
+import asyncio
 import os
 import random
 # [FROZEN] DO NOT MODIFY: Core ML Logic verified in Phase 2
 import sqlite3
 import sys
-import time
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
+import httpx
 import pandas as pd
-import toml
+
+try:
+    import tomllib  # Python 3.11+, C-accelerated
+except ImportError:  # Python 3.10 (Docker image)
+    tomllib = None
+    import toml
 
 BASE_DIR = Path(__file__).resolve().parents[2]
 sys.path.insert(1, os.fspath(BASE_DIR))
 
-from src.Utils.tools import get_json_data, to_data_frame  # noqa: E402
+from src.Utils.tools import get_json_data_async, to_data_frame  # noqa: E402
 
 CONFIG_PATH = BASE_DIR / "config.toml"
 DB_PATH = BASE_DIR / "Data" / "TeamData.sqlite"
 MIN_DELAY_SECONDS = 1
 MAX_DELAY_SECONDS = 3
 MAX_RETRIES = 3
-
-
-def load_config():
-    return toml.load(CONFIG_PATH)
-
-
-def iter_dates(start_date, end_date):
-    date_pointer = start_date
-    while date_pointer <= end_date:
-        yield date_pointer
-        date_pointer += timedelta(days=1)
+# Concurrent requests in flight against stats.nba.com (replaces the per-date sleep)
+MAX_CONCURRENT_REQUESTS = 8
+# Date tables written per transaction before committing
+WRITE_BATCH_DATES = 50
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
+# snapshot date -> table name, so prediction_api finds "newest snapshot before
+# a date" with one primary-key range lookup instead of scanning sqlite_master
+SNAPSHOT_INDEX_DDL = (
+    "CREATE TABLE IF NOT EXISTS snapshot_index ("
+    "snapshot_date TEXT PRIMARY KEY, table_name TEXT NOT NULL)"
+)
+INDEX_SNAPSHOT_SQL = "INSERT OR REPLACE INTO snapshot_index (snapshot_date, table_name) VALUES (?, ?)"
+
+
+# Parsed config keyed by (path, mtime_ns); re-parsed only when the file changes
+_CONFIG_CACHE = {}
+
+
+def load_config(config_path=CONFIG_PATH):
+    key = (os.fspath(config_path), os.stat(config_path).st_mtime_ns)
+    config = _CONFIG_CACHE.get(key)
+    if config is None:
+        if tomllib is not None:
+            with open(config_path, "rb") as f:
+                config = tomllib.load(f)
+        else:
+            config = toml.load(config_path)
+        _CONFIG_CACHE.clear()
+        _CONFIG_CACHE[key] = config
+    return config
+
+
+def connect_db(db_path):
+    con = sqlite3.connect(db_path)
+    for pragma in SQLITE_PRAGMAS:
+        con.execute(pragma)
+    return con
+
+
+def season_bounds(value):
+    """Parse a season's start/end dates once and memoize them on the config entry."""
+    bounds = value.get("_bounds")
+    if bounds is None:
+        bounds = tuple(
+            raw if isinstance(raw, date) else date.fromisoformat(raw)
+            for raw in (value["start_date"], value["end_date"])
+        )
+        value["_bounds"] = bounds
+    return bounds
 
 
 def select_current_season(config, today):
     for season_key, value in config["get-data"].items():
-        start_date = datetime.strptime(value["start_date"], "%Y-%m-%d").date()
-        end_date = datetime.strptime(value["end_date"], "%Y-%m-%d").date()
+        start_date, end_date = season_bounds(value)
         if start_date <= today <= end_date:
             return season_key, value, start_date, end_date
     return None, None, None, None
 
 
 def get_table_dates(con):
+    # Let SQLite filter to YYYY-MM-DD shaped names; only those reach the Python parser
+    cursor = con.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' "
+        "AND name GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]'"
+    )
     table_dates = []
-    cursor = con.execute("SELECT name FROM sqlite_master WHERE type='table'")
     for (name,) in cursor.fetchall():
         try:
-            table_dates.append(datetime.strptime(name, "%Y-%m-%d").date())
+            table_dates.append(date.fromisoformat(name))
         except ValueError:
             continue
     return table_dates
 
 
-def fetch_data(url, date_pointer, start_year, season_key):
-    for attempt in range(1, MAX_RETRIES + 1):
-        raw_data = get_json_data(
-            url.format(date_pointer.month, date_pointer.day, start_year, date_pointer.year, season_key)
-        )
-        df = to_data_frame(raw_data)
-        if not df.empty:
-            return df
-        if attempt < MAX_RETRIES:
-            time.sleep(MIN_DELAY_SECONDS + random.random() * (MAX_DELAY_SECONDS - MIN_DELAY_SECONDS))
-    return pd.DataFrame(data={})
+def ensure_snapshot_index(con):
+    """Create snapshot_index and register any date table it does not list yet."""
+    con.execute(SNAPSHOT_INDEX_DDL)
+    con.execute(
+        "INSERT OR IGNORE INTO snapshot_index (snapshot_date, table_name) "
+        "SELECT name, name FROM sqlite_master WHERE type='table' "
+        "AND name GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]'"
+    )
+    con.commit()
+
+
+async def fetch_data(client, semaphore, request_url, date_pointer):
+    async with semaphore:
+        for attempt in range(1, MAX_RETRIES + 1):
+            raw_data = await get_json_data_async(client, request_url)
+            df = to_data_frame(raw_data)
+            if not df.empty:
+                return date_pointer, df
+            if attempt < MAX_RETRIES:
+                # Exponential backoff with jitter
+                await asyncio.sleep(MIN_DELAY_SECONDS * 2 ** (attempt - 1) + random.random() * (MAX_DELAY_SECONDS - MIN_DELAY_SECONDS))
+    return date_pointer, pd.DataFrame(data={})
+
+
+def write_table(con, table_name, df):
+    """
+    Replace table_name with the rows of df using a plain executemany.
+    Runs inside the caller's transaction (opening one if needed) and does not commit.
+    """
+    quoted = '"' + table_name.replace('"', '""') + '"'
+    if not con.in_transaction:
+        con.execute("BEGIN")
+    con.execute(f"DROP TABLE IF EXISTS {quoted}")
+    con.execute(pd.io.sql.get_schema(df, table_name, con=con))
+    placeholders = ",".join("?" * len(df.columns))
+    con.executemany(
+        f"INSERT INTO {quoted} VALUES ({placeholders})",
+        df.itertuples(index=False, name=None),
+    )
+
+
+async def fetch_dates(con, url, dates, start_year, season_key, existing_dates=None):
+    """
+    Fetch all dates concurrently (bounded by MAX_CONCURRENT_REQUESTS) and write
+    each one as it completes. Writes stay on the event loop thread, so SQLite
+    only ever sees a single writer, and are committed every WRITE_BATCH_DATES tables.
+    """
+    pending = 0
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    # Resolve each date's URL once up front instead of on every retry
+    format_url = url.format
+    # Table names for all dates in one vectorized strftime
+    table_names = dict(zip(dates, pd.DatetimeIndex(dates).strftime("%Y-%m-%d")))
+    limits = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+        tasks = [
+            fetch_data(
+                client, semaphore,
+                format_url(date_pointer.month, date_pointer.day, start_year, date_pointer.year, season_key),
+                date_pointer,
+            )
+            for date_pointer in dates
+        ]
+        for completed in asyncio.as_completed(tasks):
+            date_pointer, df = await completed
+            if df.empty:
+                print("No data returned for:", date_pointer)
+                continue
+
+            print("Got data:", date_pointer)
+            table_name = table_names[date_pointer]
+            df["Date"] = table_name
+            write_table(con, table_name, df)
+            con.execute(INDEX_SNAPSHOT_SQL, (table_name, table_name))
+            if existing_dates is not None:
+                existing_dates.add(date_pointer)
+
+            pending += 1
+            if pending >= WRITE_BATCH_DATES:
+                con.commit()
+                pending = 0
+
+    con.commit()
 
 
 def backfill_season(con, url, season_key, value, existing_dates, today):
-    start_date = datetime.strptime(value["start_date"], "%Y-%m-%d").date()
-    end_date = datetime.strptime(value["end_date"], "%Y-%m-%d").date()
+    start_date, end_date = season_bounds(value)
     
     # SAFETY: Only fetch up to yesterday to prevent same-day data leakage
     yesterday = today - timedelta(days=1)
     fetch_end = min(yesterday, end_date)
     
-    missing_dates = [
-        date_pointer
-        for date_pointer in iter_dates(start_date, fetch_end)
-        if date_pointer not in existing_dates
-    ]
+    existing_idx = pd.DatetimeIndex(sorted(existing_dates))
+    missing = pd.date_range(start_date, fetch_end, freq="D").difference(existing_idx)
+    missing_dates = [ts.date() for ts in missing]
 
     if not missing_dates:
         print(f"No missing dates for season {season_key} (Safety Limit: {yesterday}).")
         return
 
     print(f"Backfilling {len(missing_dates)} dates for season {season_key}.")
+    # Extra safety check
+    safe_dates = []
     for date_pointer in missing_dates:
-        # Extra safety check
         if date_pointer >= today:
             print(f"[SKIP] Skipping {date_pointer} to prevent leakage (>= {today})")
             continue
-            
-        print("Getting data:", date_pointer)
-        df = fetch_data(url, date_pointer, value["start_year"], season_key)
-        if df.empty:
-            print("No data returned for:", date_pointer)
-            continue
+        safe_dates.append(date_pointer)
 
-        table_name = date_pointer.strftime("%Y-%m-%d")
-        df["Date"] = table_name
-        df.to_sql(table_name, con, if_exists="replace", index=False)
-        existing_dates.add(date_pointer)
-
-        time.sleep(random.randint(MIN_DELAY_SECONDS, MAX_DELAY_SECONDS))
+    asyncio.run(fetch_dates(con, url, safe_dates, value["start_year"], season_key, existing_dates))
 
 
 def main(config=None, db_path=DB_PATH, today=None, backfill=False, season=None):
@@ -116,7 +228,8 @@ def main(config=None, db_path=DB_PATH, today=None, backfill=False, season=None):
     print(f"Update script running. Reference date (Today): {today}")
     print(f"Safety Policy: Fetching data ONLY up to {today - timedelta(days=1)}")
 
-    with sqlite3.connect(db_path) as con:
+    with connect_db(db_path) as con:
+        ensure_snapshot_index(con)
         existing_dates = set(get_table_dates(con))
         if backfill:
             season_items = config["get-data"].items()
@@ -154,20 +267,11 @@ def main(config=None, db_path=DB_PATH, today=None, backfill=False, season=None):
             print(f"No new dates to fetch. Latest available: {latest_date} (fetch_end={fetch_end})")
             return
 
-        for date_pointer in iter_dates(fetch_start, fetch_end):
-            print("Getting data:", date_pointer)
-            df = fetch_data(url, date_pointer, value["start_year"], season_key)
-            if df.empty:
-                print("No data returned for:", date_pointer)
-                continue
-
-            table_name = date_pointer.strftime("%Y-%m-%d")
-            df["Date"] = table_name
-            df.to_sql(table_name, con, if_exists="replace", index=False)
-
-            time.sleep(random.randint(MIN_DELAY_SECONDS, MAX_DELAY_SECONDS))
+        dates = [ts.date() for ts in pd.date_range(fetch_start, fetch_end, freq="D")]
+        print(f"Fetching {len(dates)} dates: {fetch_start} -> {fetch_end}")
+        asyncio.run(fetch_dates(con, url, dates, value["start_year"], season_key))
 
-            # TODO: Add tests
+        # TODO: Add tests
 
 
 if __name__ == "__main__":
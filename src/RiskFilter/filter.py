@@ -1,6 +1,6 @@
-from typing import List, Optional
-from pydantic import BaseModel, Field
-from enum import Enum
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from enum import Enum, IntEnum
 
 from . import config
 
@@ -10,10 +10,28 @@ class SeasonPhase(str, Enum):
     PRE_DEADLINE = "pre_trade_deadline"  # 60-75%
     LATE = "late_season"             # 75-100%
 
-class RiskDecision(BaseModel):
-    allowed: bool = Field(..., description="Whether the bet is permitted")
-    reasons: List[str] = Field(default_factory=list, description="Reasons for denial or warnings")
-    aggressiveness: float = Field(default=1.0, description="Suggested stake multiplier (0-1)")
+class RiskReason(IntEnum):
+    """Machine-readable cause of a block or warning, compared as an int."""
+    DEAD_ZONE = 1
+    LOW_PROB = 2
+    LOW_EV = 3
+    NEGATIVE_EV = 4
+    EARLY_SEASON = 5
+    PRE_DEADLINE = 6
+    CIRCUIT_BREAKER = 7  # RiskGuard: bankroll PAUSED
+
+@dataclass(slots=True, frozen=True)
+class RiskDecision:
+    """
+    allowed: Whether the bet is permitted
+    reasons: Reasons for denial or warnings
+    aggressiveness: Suggested stake multiplier (0-1)
+    codes: RiskReason of each rule that blocked or warned, for checks that should not parse reasons
+    """
+    allowed: bool
+    reasons: Tuple[str, ...] = ()
+    aggressiveness: float = 1.0
+    codes: Tuple[RiskReason, ...] = ()
 
 class RiskFilter:
     """
@@ -38,56 +56,111 @@ class RiskFilter:
         probability: float,
         ev: float,
         season_phase: Optional[SeasonPhase] = None,
+        verbose: bool = False,
     ) -> RiskDecision:
         """
         Validate if a bet is allowed.
         
+        Rules are checked cheapest-first and the first block returns straight
+        away with a shared, pre-built decision. Pass verbose=True to check
+        every rule instead and get each failing one back, its reason formatted
+        with the actual numbers.
+        
         Args:
             probability: Predicted win probability (0-1)
             ev: Expected Value from EV Engine
             season_phase: Current phase of the NBA season
+            verbose: Report every failing rule, with the offending values
             
         Returns:
             RiskDecision with allowed flag and reasons
         """
+        if verbose:
+            return self._validate_verbose(probability, ev, season_phase)
+        
+        # Rule 1: EV must be positive (hard rule)
+        if ev <= 0:
+            return _BLOCKED_NEGATIVE_EV
+        
+        # Rule 2: Probability Dead Zone
+        dead_zone_low, dead_zone_high = config.PROBABILITY_DEAD_ZONE
+        if dead_zone_low <= probability < dead_zone_high:
+            return _BLOCKED_DEAD_ZONE
+        
+        # Rule 3: Min Probability
+        if probability < self.min_probability:
+            return _BLOCKED_MIN_PROBABILITY
+        
+        # Rule 4: Min EV
+        if ev < self.min_ev:
+            return _BLOCKED_MIN_EV
+        
+        # Rule 5: Seasonal Flags
+        if season_phase == SeasonPhase.EARLY and self.block_early_season:
+            return _BLOCKED_EARLY_SEASON
+        
+        if season_phase == SeasonPhase.PRE_DEADLINE and self.reduce_pre_deadline:
+            return _ALLOWED_PRE_DEADLINE
+        
+        return _ALLOWED_NORMAL
+
+    def _validate_verbose(self, probability: float, ev: float, season_phase: Optional[SeasonPhase]) -> RiskDecision:
+        """validate() evaluating every rule, in the same order, collecting all failures."""
         reasons = []
-        allowed = True
-        aggressiveness = config.AGGRESSIVENESS_NORMAL
+        codes = []
+        
+        if ev <= 0:
+            reasons.append(f"BLOCKED: Negative or zero EV ({ev:.1%})")
+            codes.append(RiskReason.NEGATIVE_EV)
         
-        # Rule 1: Probability Dead Zone
         dead_zone_low, dead_zone_high = config.PROBABILITY_DEAD_ZONE
         if dead_zone_low <= probability < dead_zone_high:
-            allowed = False
             reasons.append(f"BLOCKED: Probability {probability:.1%} in dead zone [{dead_zone_low:.0%}-{dead_zone_high:.0%})")
+            codes.append(RiskReason.DEAD_ZONE)
         
-        # Rule 2: Min Probability
         if probability < self.min_probability:
-            allowed = False
             reasons.append(f"BLOCKED: Probability {probability:.1%} < min {self.min_probability:.0%}")
+            codes.append(RiskReason.LOW_PROB)
         
-        # Rule 3: Min EV
-        if ev < self.min_ev:
-            allowed = False
+        # A non-positive EV is already reported above
+        if 0 < ev < self.min_ev:
             reasons.append(f"BLOCKED: EV {ev:.1%} < min {self.min_ev:.0%}")
+            codes.append(RiskReason.LOW_EV)
         
-        # Rule 4: Seasonal Flags
-        if season_phase:
-            if season_phase == SeasonPhase.EARLY and self.block_early_season:
-                allowed = False
-                aggressiveness = config.AGGRESSIVENESS_EARLY_SEASON
-                reasons.append("BLOCKED: Early season (volatile W_PCT)")
-            
-            elif season_phase == SeasonPhase.PRE_DEADLINE and self.reduce_pre_deadline:
-                aggressiveness = config.AGGRESSIVENESS_PRE_DEADLINE
-                reasons.append(f"WARNING: Pre-trade deadline (aggressiveness reduced to {aggressiveness*100:.0f}%)")
+        if season_phase == SeasonPhase.EARLY and self.block_early_season:
+            reasons += _BLOCKED_EARLY_SEASON.reasons
+            codes += _BLOCKED_EARLY_SEASON.codes
         
-        # Rule 5: EV must be positive (hard rule)
-        if ev <= 0:
-            allowed = False
-            reasons.append(f"BLOCKED: Negative or zero EV ({ev:.1%})")
+        if codes:
+            return RiskDecision(allowed=False, reasons=tuple(reasons), aggressiveness=0.0, codes=tuple(codes))
         
-        return RiskDecision(
-            allowed=allowed,
-            reasons=reasons,
-            aggressiveness=aggressiveness if allowed else 0.0
-        )
+        if season_phase == SeasonPhase.PRE_DEADLINE and self.reduce_pre_deadline:
+            return _ALLOWED_PRE_DEADLINE
+        
+        return _ALLOWED_NORMAL
+
+
+def _blocked(reason: str, code: RiskReason) -> RiskDecision:
+    return RiskDecision(allowed=False, reasons=(reason,), aggressiveness=0.0, codes=(code,))
+
+
+# Shared deny decisions for the non-verbose path
+_BLOCKED_NEGATIVE_EV = _blocked("BLOCKED: Negative or zero EV", RiskReason.NEGATIVE_EV)
+_BLOCKED_DEAD_ZONE = _blocked("BLOCKED: Probability in dead zone", RiskReason.DEAD_ZONE)
+_BLOCKED_MIN_PROBABILITY = _blocked("BLOCKED: Probability below min", RiskReason.LOW_PROB)
+_BLOCKED_MIN_EV = _blocked("BLOCKED: EV below min", RiskReason.LOW_EV)
+_BLOCKED_EARLY_SEASON = _blocked("BLOCKED: Early season (volatile W_PCT)", RiskReason.EARLY_SEASON)
+_SHARED_BLOCKS = (_BLOCKED_NEGATIVE_EV, _BLOCKED_DEAD_ZONE, _BLOCKED_MIN_PROBABILITY, _BLOCKED_MIN_EV, _BLOCKED_EARLY_SEASON)
+
+_PRE_DEADLINE_WARNING = (
+    f"WARNING: Pre-trade deadline (aggressiveness reduced to {config.AGGRESSIVENESS_PRE_DEADLINE*100:.0f}%)"
+)
+
+# Shared allowed decisions; the common cleared-bet path allocates nothing
+_ALLOWED_NORMAL = RiskDecision(allowed=True, reasons=(), aggressiveness=config.AGGRESSIVENESS_NORMAL)
+_ALLOWED_PRE_DEADLINE = RiskDecision(
+    allowed=True,
+    reasons=(_PRE_DEADLINE_WARNING,),
+    aggressiveness=config.AGGRESSIVENESS_PRE_DEADLINE,
+    codes=(RiskReason.PRE_DEADLINE,),
+)
@@ -2,31 +2,117 @@
 Audit Logger Service
 ====================
 Immutable append-only behavior log for Phase 6 observability.
+
+Events are queued and written by a background thread that owns a single
+WAL connection and inserts them in batches, so logging never blocks the
+betting pipeline on an fsync.
 """
-import sqlite3
+import atexit
+import logging
+import queue
 import json
+import sqlite3
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from src.BankrollEngine.service import get_bankroll_service
 
+logger = logging.getLogger("AuditLogger")
+
+# Max events written per transaction by the background writer
+BATCH_SIZE = 500
+# Tries per batch when the DB is busy/locked; the batch is dropped after the last
+WRITE_ATTEMPTS = 3
+RETRY_DELAY_S = 0.5
+
+_INSERT_SQL = """
+    INSERT INTO audit_log (event_type, game_id, details, old_state, new_state)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+# Tells the writer thread to drain what is left and exit
+_STOP = object()
+
 class AuditLogger:
     """Append-only behavior log."""
-    
+
     def __init__(self):
-        self._db_path = get_bankroll_service().db_path
+        self._bankroll_service = get_bankroll_service()
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._writer, name="AuditLogger", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _writer(self):
+        """Drain the queue in batches of up to BATCH_SIZE, one transaction each."""
+        # Created here so the connection only ever lives on the writer thread
+        con = self._bankroll_service.connect()
+        con.execute("PRAGMA journal_mode=WAL")
+        con.execute("PRAGMA synchronous=NORMAL")
+        try:
+            stop = False
+            while not stop:
+                batch = [self._queue.get()]
+                while len(batch) < BATCH_SIZE:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                rows = [item for item in batch if item is not _STOP]
+                stop = len(rows) != len(batch)
+                try:
+                    if rows:
+                        self._write_batch(con, rows)
+                finally:
+                    # Written or dropped, so flush() never hangs on a bad batch
+                    for _ in batch:
+                        self._queue.task_done()
+        finally:
+            con.close()
+
+    def _write_batch(self, con, rows):
+        """
+        Insert one batch. OperationalError (locked, busy, disk I/O) is retried
+        up to WRITE_ATTEMPTS times; after that, or on any other sqlite3 error,
+        the batch is logged and dropped so the writer thread keeps running.
+        """
+        for attempt in range(1, WRITE_ATTEMPTS + 1):
+            try:
+                with con:
+                    con.executemany(_INSERT_SQL, rows)
+                return
+            except sqlite3.OperationalError as e:
+                error = e
+                if attempt < WRITE_ATTEMPTS:
+                    logger.warning(f"Audit batch write failed ({e}), retry {attempt}/{WRITE_ATTEMPTS - 1}")
+                    time.sleep(RETRY_DELAY_S * attempt)
+            except sqlite3.Error as e:
+                error = e
+                break
+        logger.error(f"Dropped {len(rows)} audit event(s): {error}")
 
     def log(self, event_type: str, game_id: str = None, details: str = "", old_state: str = None, new_state: str = None):
         """
         Log an event. Append-only.
-        
+
         event_type: BET_TAKEN, BET_BLOCKED, RISK_TRIGGER, STATE_CHANGE
         """
-        with sqlite3.connect(self._db_path) as con:
-            con.execute("""
-                INSERT INTO audit_log (event_type, game_id, details, old_state, new_state)
-                VALUES (?, ?, ?, ?, ?)
-            """, (event_type, game_id, details, old_state, new_state))
+        self._queue.put((event_type, game_id, details, old_state, new_state))
+
+    def flush(self):
+        """Block until every queued event has been written."""
+        if self._thread.is_alive():
+            self._queue.join()
+
+    def close(self):
+        """Write pending events and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
 
     def log_bet_taken(self, game_id: str, stake: float, ev: float):
         self.log("BET_TAKEN", game_id, json.dumps({"stake": stake, "ev": ev}))
@@ -40,5 +126,6 @@ class AuditLogger:
     def log_state_change(self, old: str, new: str, reason: str):
         self.log("STATE_CHANGE", None, reason, old, new)
 
+@lru_cache(maxsize=1)
 def get_audit_logger():
     return AuditLogger()
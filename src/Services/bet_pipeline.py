@@ -1,21 +1,29 @@
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
 import logging
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
 
 # Services
-from src.EVEngine.ev_calculator import calculate_ev, EVResult
-from src.Services.risk_guard import get_risk_guard, RiskDecision
+from src.EVEngine.ev_calculator import calculate_ev, calculate_ev_batch, EVResult
+from src.Services.risk_guard import get_risk_guard, RiskDecision, _BLOCK_REASON_BY_CODE
 from src.BankrollEngine.service import get_bankroll_service
-from src.StakeEngine.calculator import calculate_stake, StakeResult
+from src.StakeEngine.calculator import calculate_stake, calculate_kelly_batch, StakeResult
 
 # Configure logging
 logger = logging.getLogger("BetPipeline")
 
-class BetDecision(BaseModel):
-    """Final decision output from the pipeline."""
+@dataclass(slots=True, frozen=True)
+class BetDecision:
+    """
+    Final decision output from the pipeline.
+    decision: BET, PASS, or BLOCKED
+    """
     game_id: str
-    decision: str = Field(..., description="BET, PASS, or BLOCKED")
+    decision: str
     stake_units: float = 0.0
     ev_result: Optional[EVResult] = None
     risk_decision: Optional[RiskDecision] = None
@@ -102,9 +110,62 @@ class BetPipeline:
             ev_result=ev_res,
             risk_decision=risk_decision,
             stake_result=stake_res,
-            reason=f"Approved. EV: {ev_res.ev:.1%}, Stake: {stake_res.recommended_stake}U"
+            reason=f"Approved. EV: {ev_res.ev:.1%}, Stake: {round(stake_res.recommended_stake, 4)}U"
         )
 
+    def batch_process(self, games_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Vectorized process_bet for backtests.
+        
+        games_df needs columns game_id, probability, odds and game_date. The
+        sanity and EV gates are evaluated as NumPy masks over the whole frame
+        and the risk rules by RiskGuard.validate_bets; only rows that clear all
+        of them go through process_bet for stake sizing.
+        
+        Returns one row per game with game_id, decision, stake_units, ev, kelly, reason.
+        """
+        p = games_df["probability"].to_numpy(dtype=np.float64)
+        odds = games_df["odds"].to_numpy(dtype=np.float64)
+        dates = pd.to_datetime(games_df["game_date"])
+        
+        ev, positive_ev = calculate_ev_batch(p, odds)
+        kelly = calculate_kelly_batch(p, odds)
+        allowed, codes, _ = self.risk_guard.validate_bets(p, ev, dates)
+        
+        # Same order as the scalar pipeline; np.select takes the first match
+        conditions = [
+            ~((p >= 0.0) & (p <= 1.0)),
+            odds <= 1.0,
+            ~positive_ev,
+            ~allowed,
+        ]
+        decisions = np.select(conditions, ["PASS", "PASS", "PASS", "BLOCKED"], default="")
+        reasons = np.select(conditions, [
+            "Invalid probability",
+            "Invalid odds",
+            "Negative Value",
+            _BLOCK_REASON_BY_CODE[codes],
+        ], default="")
+        
+        result = pd.DataFrame({
+            "game_id": games_df["game_id"].to_numpy(),
+            "decision": decisions.astype(object),
+            "stake_units": 0.0,
+            "ev": ev,
+            "kelly": kelly,
+            "reason": reasons.astype(object),
+        })
+        
+        # Survivors (usually a small minority) take the full scalar path
+        survivors = np.flatnonzero(decisions == "")
+        for i in survivors:
+            d = self.process_bet(result.at[i, "game_id"], p[i], odds[i], dates.iloc[i])
+            result.at[i, "decision"] = d.decision
+            result.at[i, "stake_units"] = d.stake_units
+            result.at[i, "reason"] = d.reason
+        
+        return result
+
     def _pass(self, game_id, reason, ev_res=None, risk_decision=None, stake_res=None):
         return BetDecision(
             game_id=game_id,
@@ -125,5 +186,6 @@ class BetPipeline:
         )
 
 # Global Accessor
+@lru_cache(maxsize=1)
 def get_bet_pipeline():
     return BetPipeline()
@@ -9,6 +9,13 @@ from sbrscrape import Scoreboard
 import history_db
 import difflib
 
+from src.DataProviders.aggregator import EXECUTOR
+
+# SBR team name -> name stored in the predictions table
+TEAM_ALIASES = {
+    "Los Angeles Clippers": "LA Clippers",
+}
+
 def american_to_decimal(american_odds):
     if not american_odds: return 0.0
     if american_odds >= 100:
@@ -16,6 +23,10 @@ def american_to_decimal(american_odds):
     else:
         return (100 / abs(american_odds)) + 1
 
+def _fetch_sbr_games(date_str):
+    sb = Scoreboard(sport="NBA", date=date_str)
+    return sb.games if hasattr(sb, 'games') else []
+
 def update_pending_predictions():
     """
     Checks for pending predictions in the database and updates them 
@@ -23,42 +34,42 @@ def update_pending_predictions():
     """
     print("[History Service] Checking for pending predictions...")
     
-    # 1. Get dates with pending predictions
-    pending_dates = []
+    # 1. Get pending match_ids grouped by date in a single query.
+    # Only dates that still have pending games show up, so graded dates are never rescraped.
+    pending_by_date = {}
     
     # Supabase version
     client = history_db._get_supabase()
     if client:
         try:
             today_str = datetime.now().strftime('%Y-%m-%d')
-            res = client.table('predictions').select('date').eq('result', 'PENDING').lte('date', today_str).execute()
-            pending_dates = list(set([row['date'] for row in res.data]))
+            res = client.table('predictions').select('date, match_id').eq('result', 'PENDING').lte('date', today_str).execute()
+            for row in res.data:
+                pending_by_date.setdefault(row['date'], []).append(row['match_id'])
         except Exception as e:
             print(f"[History Service DB Error] {e}")
-        
+    
+    pending_dates = list(pending_by_date)
     print(f"[History Service] Found pending predictions for dates: {pending_dates}")
     
+    # 2. Fetch scores for every date concurrently; SBR calls are independent I/O
+    scoreboards = {d: EXECUTOR.submit(_fetch_sbr_games, d) for d in pending_dates}
+    
     updated_count = 0
+    # (date, match_id, winner) across every date, written in one bulk update
+    all_results = []
     
     for date_str in pending_dates:
         print(f"[History Service] Updating results for {date_str}...")
         try:
-            # 2. Fetch scores for that date
-            sb = Scoreboard(sport="NBA", date=date_str)
-            games = sb.games if hasattr(sb, 'games') else []
+            games = scoreboards[date_str].result()
             
             if not games:
                 print(f"[History Service] No games found for {date_str} in SBR.")
                 continue
             
-            # 2.5 Get pending match_ids for this specific date from Supabase
-            # to use for fuzzy matching
-            db_matches = []
-            try:
-                res = history_db._get_supabase().table('predictions').select('match_id').eq('date', date_str).eq('result', 'PENDING').execute()
-                db_matches = [r['match_id'] for r in res.data]
-            except:
-                pass
+            # 2.5 Pending match_ids for this date, used for fuzzy matching
+            db_matches = pending_by_date[date_str]
                 
             # Create a map of actual results
             # Key: mismo formato que la DB (date_away_home con espacios -> _)
@@ -74,8 +85,8 @@ def update_pending_predictions():
                 
                 if home and away and home_score is not None and away_score is not None:
                     # Normalize names if needed (SBR <-> DB)
-                    home = home.replace("Los Angeles Clippers", "LA Clippers")
-                    away = away.replace("Los Angeles Clippers", "LA Clippers")
+                    home = TEAM_ALIASES.get(home, home)
+                    away = TEAM_ALIASES.get(away, away)
                     
                     winner = home if home_score > away_score else away
                     
@@ -97,12 +108,14 @@ def update_pending_predictions():
                         if away_parts.lower() in db_m.lower() and home_parts.lower() in db_m.lower():
                             results_map[db_m] = winner
                             
-            # 3. Update DB
-            history_db.update_results(date_str, results_map)
+            all_results.extend((date_str, match_id, winner) for match_id, winner in results_map.items())
             updated_count += len(results_map)
             
         except Exception as e:
             print(f"[History Service] Error processing {date_str}: {e}")
             
+    # 3. Update DB
+    history_db.update_results_bulk(all_results)
+    
     print(f"[History Service] Update complete. Updated {updated_count} matches.")
     return {"status": "success", "updated_count": updated_count}
@@ -1,12 +1,52 @@
+from bisect import bisect_right
+from dataclasses import replace
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Tuple
 import logging
 
+import numpy as np
+import pandas as pd
+
 from src.BankrollEngine.service import get_bankroll_service
-from src.RiskFilter.filter import RiskFilter, SeasonPhase, RiskDecision
+from src.RiskFilter import config as risk_config
+from src.RiskFilter.filter import RiskFilter, SeasonPhase, RiskDecision, RiskReason, _SHARED_BLOCKS
 
 logger = logging.getLogger("RiskGuard")
 
+# Season calendar as sorted month * 32 + day boundaries; a day's phase is the
+# segment it falls in, found by bisection instead of a chain of month checks.
+# Early: Oct 1 - Dec 24 | Mid: Dec 25 - Jan | Pre-Deadline: Feb | Late: Mar, Apr
+# Mid is also the default for the playoffs/off-season (May - Sep)
+PHASE_BOUNDARIES = (2 * 32 + 1, 3 * 32 + 1, 5 * 32 + 1, 10 * 32 + 1, 12 * 32 + 25)
+PHASE_BY_SEGMENT = (
+    SeasonPhase.MID,
+    SeasonPhase.PRE_DEADLINE,
+    SeasonPhase.LATE,
+    SeasonPhase.MID,
+    SeasonPhase.EARLY,
+    SeasonPhase.MID,
+)
+
+@lru_cache(maxsize=512)
+def _phase_for(month: int, day: int) -> SeasonPhase:
+    """
+    Season phase for a calendar day. Only (month, day) matters, so backtests
+    over whole seasons hit the cache for every game after the first of a day.
+    """
+    return PHASE_BY_SEGMENT[bisect_right(PHASE_BOUNDARIES, month * 32 + day)]
+
+# The same calendar as arrays, for np.searchsorted over month * 32 + day keys
+_PHASE_BOUNDARIES = np.array(PHASE_BOUNDARIES)
+_EARLY_BY_SEGMENT = np.array([phase == SeasonPhase.EARLY for phase in PHASE_BY_SEGMENT])
+_PRE_DEADLINE_BY_SEGMENT = np.array([phase == SeasonPhase.PRE_DEADLINE for phase in PHASE_BY_SEGMENT])
+
+# Pre-warm every calendar day (incl. Feb 29) so no lookup pays for a miss
+for _m in range(1, 13):
+    for _d in range(1, 32):
+        _phase_for(_m, _d)
+del _m, _d
+
 class RiskGuard:
     """
     Final Gatekeeper for betting operations.
@@ -23,53 +63,46 @@ class RiskGuard:
         Hard-coded season phases based on typical NBA calendar (Oct-April).
         Mid-season starts ~Dec 25. Pre-deadline ~Feb 1. Late ~Mar 15.
         """
-        # Simplify: mapped by month for robustness
-        # Early: Oct, Nov, Dec (start) -> 0 - 25%
-        # Mid: Jan, Feb (start) -> 25 - 60%
-        # Pre-Deadline: Feb (end) -> 60 - 75%
-        # Late: Mar, Apr -> 75 - 100%
-        
-        m = game_date.month
-        d = game_date.day
-        
-        if m in [10, 11]:
-            return SeasonPhase.EARLY
-        if m == 12:
-            return SeasonPhase.EARLY if d < 25 else SeasonPhase.MID
-        if m == 1:
-            return SeasonPhase.MID
-        if m == 2:
-            return SeasonPhase.PRE_DEADLINE
-        if m in [3, 4]:
-            return SeasonPhase.LATE
-            
-        return SeasonPhase.MID # Default for playoffs/other
+        return _phase_for(game_date.month, game_date.day)
 
-    def validate_bet(self, probability: float, ev: float, game_date: datetime) -> RiskDecision:
+    def validate_bet(self, probability: float, ev: float, game_date: datetime, thorough: bool = False) -> RiskDecision:
         """
         Main validation entry point.
+        
+        Hard rules run first and the first failure returns straight away: the
+        circuit breaker reads the service's cached status, the season rule is a
+        cached calendar lookup. Pass thorough=True to evaluate every rule and
+        get all failing reasons back, for debugging a rejection.
         """
+        reasons = ()
+        codes = ()
+        
         # 1. Circuit Breaker Check (Bankroll Status)
         status = self.bankroll_service.operational_status
         if status == "PAUSED":
-            return RiskDecision(
-                allowed=False,
-                reasons=["CIRCUIT BREAKER: System is PAUSED due to consecutive losses or severe drawdown."],
-                aggressiveness=0.0
-            )
+            if not thorough:
+                return _BLOCKED_CIRCUIT_BREAKER
+            reasons += _BLOCKED_CIRCUIT_BREAKER.reasons
+            codes += _BLOCKED_CIRCUIT_BREAKER.codes
 
         # 2. Hard Rule: Early Season Block
-        phase = self._determine_phase(game_date)
+        # Overrule config: ALWAYS BLOCK
+        phase = _phase_for(game_date.month, game_date.day)
         if phase == SeasonPhase.EARLY:
-            # Overrule config: ALWAYS BLOCK
-            return RiskDecision(
-                allowed=False,
-                reasons=["HARD RULE: Early Season bets are strictly prohibited (Oct-Dec 25)."],
-                aggressiveness=0.0
-            )
+            if not thorough:
+                return _BLOCKED_EARLY_SEASON
+            reasons += _BLOCKED_EARLY_SEASON.reasons
+            codes += _BLOCKED_EARLY_SEASON.codes
 
-        # 3. Standard Risk Filter
-        decision = self.risk_filter.validate(probability, ev, phase)
+        # 3. Standard Risk Filter (no phase for early season: blocked above)
+        decision = self.risk_filter.validate(
+            probability, ev, None if phase == SeasonPhase.EARLY else phase, verbose=thorough
+        )
+        if reasons:
+            if not decision.allowed:
+                reasons += decision.reasons
+                codes += decision.codes
+            return RiskDecision(allowed=False, reasons=reasons, aggressiveness=0.0, codes=codes)
         
         # 4. Bankroll Degradation Logic
         if decision.allowed and status == "DEGRADED":
@@ -77,10 +110,86 @@ class RiskGuard:
             # BankrollService.kelly_fraction gives the FRACTION.
             # Here we just pass the decision mostly.
             # But we can annotate the reason.
-            decision.reasons.append("WARNING: Operating in DEGRADED mode (Drawdown > 20%).")
+            # Decisions are frozen and may be shared, so annotate a copy
+            decision = replace(
+                decision,
+                reasons=decision.reasons + ("WARNING: Operating in DEGRADED mode (Drawdown > 20%).",)
+            )
             
         return decision
 
+    def validate_bets(self, probabilities, evs, game_dates) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized validate_bet for many candidates at once.
+        
+        The same rules in the same order as validate_bet, evaluated as NumPy
+        masks; bankroll status is read once for the whole batch. game_dates is
+        anything pd.DatetimeIndex accepts.
+        
+        Returns (allowed, codes, aggressiveness) arrays. codes holds the
+        RiskReason of the rule that blocked each bet, PRE_DEADLINE for allowed
+        bets with reduced aggressiveness, and 0 for a clean allow.
+        """
+        p = np.asarray(probabilities, dtype=np.float64)
+        ev = np.asarray(evs, dtype=np.float64)
+        dates = pd.DatetimeIndex(game_dates)
+        segment = np.searchsorted(_PHASE_BOUNDARIES, dates.month * 32 + dates.day, side="right")
+        
+        risk_filter = self.risk_filter
+        dead_zone_low, dead_zone_high = risk_config.PROBABILITY_DEAD_ZONE
+        paused = self.bankroll_service.operational_status == "PAUSED"
+        
+        # np.select takes the first match, mirroring validate_bet's early returns
+        codes = np.select(
+            [
+                np.full(p.shape, paused),
+                _EARLY_BY_SEGMENT[segment],
+                ev <= 0,
+                (p >= dead_zone_low) & (p < dead_zone_high),
+                p < risk_filter.min_probability,
+                ev < risk_filter.min_ev,
+            ],
+            [
+                RiskReason.CIRCUIT_BREAKER,
+                RiskReason.EARLY_SEASON,
+                RiskReason.NEGATIVE_EV,
+                RiskReason.DEAD_ZONE,
+                RiskReason.LOW_PROB,
+                RiskReason.LOW_EV,
+            ],
+            default=0,
+        ).astype(np.int8)
+        
+        allowed = codes == 0
+        reduced = allowed & _PRE_DEADLINE_BY_SEGMENT[segment] if risk_filter.reduce_pre_deadline else np.zeros_like(allowed)
+        codes[reduced] = RiskReason.PRE_DEADLINE
+        aggressiveness = np.where(
+            reduced, risk_config.AGGRESSIVENESS_PRE_DEADLINE, np.where(allowed, risk_config.AGGRESSIVENESS_NORMAL, 0.0)
+        )
+        return allowed, codes, aggressiveness
+
+# Shared hard-rule denials
+_BLOCKED_EARLY_SEASON = RiskDecision(
+    allowed=False,
+    reasons=("HARD RULE: Early Season bets are strictly prohibited (Oct-Dec 25).",),
+    aggressiveness=0.0,
+    codes=(RiskReason.EARLY_SEASON,),
+)
+_BLOCKED_CIRCUIT_BREAKER = RiskDecision(
+    allowed=False,
+    reasons=("CIRCUIT BREAKER: System is PAUSED due to consecutive losses or severe drawdown.",),
+    aggressiveness=0.0,
+    codes=(RiskReason.CIRCUIT_BREAKER,),
+)
+
+# validate_bet's fast-path reason per block code, indexable by validate_bets codes.
+# The guard's own early-season text goes in last, since the guard blocks first
+_BLOCK_REASON_BY_CODE = np.full(max(RiskReason) + 1, "", dtype=object)
+for _d in _SHARED_BLOCKS + (_BLOCKED_EARLY_SEASON, _BLOCKED_CIRCUIT_BREAKER):
+    _BLOCK_REASON_BY_CODE[_d.codes[0]] = _d.reasons[0]
+del _d
+
 # Function to get singleton/service
+@lru_cache(maxsize=1)
 def get_risk_guard():
     return RiskGuard()
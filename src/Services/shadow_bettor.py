@@ -2,13 +2,23 @@ from datetime import datetime
 import json
 import logging
 import sqlite3
+import threading
 from pathlib import Path
+from typing import Iterable, List, Tuple
+from functools import lru_cache
 
 from src.Services.bet_pipeline import get_bet_pipeline, BetDecision
 from src.BankrollEngine.service import get_bankroll_service
 
 logger = logging.getLogger("ShadowBettor")
 
+_INSERT_SQL = """
+    INSERT INTO shadow_bets (
+        game_id, decision, probability, odds, ev, 
+        stake_units, kelly_fraction, status, reason
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 class ShadowBettor:
     """
     Executes betting decisions in 'Paper Trading' mode.
@@ -18,8 +28,24 @@ class ShadowBettor:
     def __init__(self):
         self.pipeline = get_bet_pipeline()
         self.bankroll_service = get_bankroll_service() # Need DB access
-        # Ensure DB is init
-        self._db_path = self.bankroll_service.db_path
+        # One connection reused for every insert, opened on first write. The
+        # accessor hands this instance to every request thread, so the
+        # connection is shared across threads and guarded by _con_lock
+        self._con = None
+        self._con_lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Shared connection; only use it while holding _con_lock."""
+        if self._con is None:
+            self._con = self.bankroll_service.connect(check_same_thread=False)
+        return self._con
+
+    def close(self):
+        """Close the shared connection; the next write opens a new one."""
+        with self._con_lock:
+            if self._con is not None:
+                self._con.close()
+                self._con = None
 
     def process_game(self, game_id: str, probability: float, odds: float, game_date: datetime) -> BetDecision:
         """
@@ -33,39 +59,67 @@ class ShadowBettor:
         
         return decision
 
+    def process_games(self, batch: Iterable[Tuple[str, float, float, datetime]]) -> List[BetDecision]:
+        """
+        Run the pipeline for (game_id, probability, odds, game_date) tuples
+        and write every shadow bet in a single transaction.
+        """
+        decisions = []
+        # Local to this call: concurrent batches never see each other's rows
+        rows = []
+        for game_id, probability, odds, game_date in batch:
+            d = self.pipeline.process_bet(game_id, probability, odds, game_date)
+            decisions.append(d)
+            rows.append(self._shadow_row(d, probability, odds))
+        
+        self._insert_rows(rows)
+        return decisions
+
+    def _insert_rows(self, rows: List[tuple]):
+        """Insert shadow bets with one executemany + commit."""
+        if not rows:
+            return
+        
+        try:
+            with self._con_lock, self._connection() as con:
+                con.executemany(_INSERT_SQL, rows)
+            logger.info(f"Shadow Bets Logged: {len(rows)} decisions")
+        except Exception as e:
+            logger.error(f"Failed to log {len(rows)} shadow bets: {str(e)}")
+
+    @staticmethod
+    def _shadow_row(d: BetDecision, prob: float, odds: float) -> tuple:
+        # Extract EV if available
+        ev = d.ev_result.ev if d.ev_result else 0.0
+        
+        # Extract Kelly from StakeResult if available, else infer/default
+        kelly = 0.0
+        if d.stake_result:
+            kelly = d.stake_result.kelly_fraction
+        
+        return (
+            d.game_id, 
+            d.decision, 
+            prob, 
+            odds, 
+            ev,
+            d.stake_units,
+            kelly,
+            "PENDING", # Always pending until graded
+            d.reason
+        )
+
     def _log_shadow_bet(self, d: BetDecision, prob: float, odds: float):
         """Persist decision to SQLite."""
         try:
-            with sqlite3.connect(self._db_path) as con:
-                # Extract EV if available
-                ev = d.ev_result.ev if d.ev_result else 0.0
-                
-                # Extract Kelly from StakeResult if available, else infer/default
-                kelly = 0.0
-                if d.stake_result:
-                    kelly = d.stake_result.kelly_fraction
-                
-                con.execute("""
-                    INSERT INTO shadow_bets (
-                        game_id, decision, probability, odds, ev, 
-                        stake_units, kelly_fraction, status, reason
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    d.game_id, 
-                    d.decision, 
-                    prob, 
-                    odds, 
-                    ev,
-                    d.stake_units,
-                    kelly,
-                    "PENDING", # Always pending until graded
-                    d.reason
-                ))
+            with self._con_lock, self._connection() as con:
+                con.execute(_INSERT_SQL, self._shadow_row(d, prob, odds))
                 logger.info(f"Shadow Bet Logged: {d.game_id} -> {d.decision}")
                 
         except Exception as e:
             logger.error(f"Failed to log shadow bet for {d.game_id}: {str(e)}")
 
 # Global Accessor
+@lru_cache(maxsize=1)
 def get_shadow_bettor():
     return ShadowBettor()
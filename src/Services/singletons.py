@@ -0,0 +1,37 @@
+"""
+Service Singletons
+==================
+The get_* accessors in src.Services cache one instance per process.
+Tests that swap databases call reset_singletons() so the next accessor
+call builds fresh objects.
+"""
+import threading
+
+from src.BankrollEngine.service import BankrollService
+from src.Services.audit_logger import get_audit_logger
+from src.Services.risk_guard import get_risk_guard
+from src.Services.bet_pipeline import get_bet_pipeline
+from src.Services.shadow_bettor import get_shadow_bettor
+
+_reset_lock = threading.Lock()
+
+def reset_singletons():
+    """
+    Drop every cached service instance, flushing the audit log first and
+    closing the connections the shadow bettor and bankroll service hold.
+    """
+    with _reset_lock:
+        if get_audit_logger.cache_info().currsize:
+            get_audit_logger().close()
+        if get_shadow_bettor.cache_info().currsize:
+            get_shadow_bettor().close()
+        for accessor in (get_shadow_bettor, get_bet_pipeline, get_risk_guard, get_audit_logger):
+            accessor.cache_clear()
+
+        with BankrollService._lock:
+            svc = BankrollService._instance
+            if svc is not None and svc._keepalive is not None:
+                # Last connection to a memory DB: closing it frees the DB
+                svc._keepalive.close()
+                svc._keepalive = None
+            BankrollService._instance = None
@@ -1,14 +1,24 @@
+from dataclasses import dataclass
 from typing import Optional
-from pydantic import BaseModel, Field
+
+import numpy as np
 
 from . import config
 
-class StakeResult(BaseModel):
-    kelly_fraction: float = Field(..., description="Raw Kelly fraction (f*)")
-    recommended_stake: float = Field(..., description="Final stake in units after all adjustments")
-    stake_percent: float = Field(..., description="Stake as percentage of bankroll")
-    was_capped: bool = Field(default=False, description="True if stake was capped by max limit")
-    was_zeroed: bool = Field(default=False, description="True if stake was forced to 0 due to negative edge")
+@dataclass(slots=True, frozen=True)
+class StakeResult:
+    """
+    kelly_fraction: Raw Kelly fraction (f*)
+    recommended_stake: Final stake in units after all adjustments
+    stake_percent: Stake as percentage of bankroll
+    was_capped: True if stake was capped by max limit
+    was_zeroed: True if stake was forced to 0 due to negative edge
+    """
+    kelly_fraction: float
+    recommended_stake: float
+    stake_percent: float
+    was_capped: bool = False
+    was_zeroed: bool = False
 
 def calculate_kelly(probability: float, odds: float) -> float:
     """
@@ -27,6 +37,16 @@ def calculate_kelly(probability: float, odds: float) -> float:
     kelly = numerator / denominator
     return kelly
 
+def calculate_kelly_batch(probabilities: np.ndarray, odds: np.ndarray) -> np.ndarray:
+    """
+    Vectorized raw Kelly fraction (same formula as calculate_kelly).
+    Entries with odds <= 1.0 are 0.0, as in the scalar version.
+    """
+    p = np.asarray(probabilities, dtype=np.float64)
+    o = np.asarray(odds, dtype=np.float64)
+    kelly = np.zeros(np.broadcast(p, o).shape)
+    return np.divide(p * o - 1.0, o - 1.0, out=kelly, where=o > 1.0)
+
 def calculate_stake(
     probability: float,
     odds: float,
@@ -52,12 +72,8 @@ def calculate_stake(
     # Calculate raw Kelly
     kelly = calculate_kelly(probability, odds)
     
-    was_zeroed = False
-    was_capped = False
-    
     # Hard rule: Negative or zero Kelly = no bet
     if kelly <= 0:
-        was_zeroed = True
         return StakeResult(
             kelly_fraction=kelly,
             recommended_stake=0.0,
@@ -66,36 +82,28 @@ def calculate_stake(
             was_zeroed=True
         )
     
-    # Apply fractional Kelly
-    fractional_stake = kelly * fractional_kelly
-    
-    # Apply aggressiveness from Risk Filter
-    adjusted_stake = fractional_stake * aggressiveness
-    
-    # Convert to units
-    stake_units = bankroll * adjusted_stake
+    # Fractional Kelly and Risk Filter aggressiveness, converted to units in one product
+    stake_units = bankroll * kelly * fractional_kelly * aggressiveness
     
     # Apply max cap
     max_stake_units = bankroll * max_stake_percent
-    if stake_units > max_stake_units:
+    was_capped = stake_units > max_stake_units
+    if was_capped:
         stake_units = max_stake_units
-        was_capped = True
     
-    # Apply minimum threshold
-    if stake_units < config.MIN_STAKE_UNITS:
+    # Apply minimum threshold (also catches anything non-positive)
+    was_zeroed = stake_units < config.MIN_STAKE_UNITS
+    if was_zeroed:
         stake_units = 0.0
-        was_zeroed = True
-    
-    # Ensure non-negative
-    stake_units = max(0.0, stake_units)
     
     # Calculate final percentage
     stake_percent = stake_units / bankroll if bankroll > 0 else 0.0
     
+    # Raw floats; round only when displaying
     return StakeResult(
         kelly_fraction=kelly,
-        recommended_stake=round(stake_units, 4),
-        stake_percent=round(stake_percent, 6),
+        recommended_stake=stake_units,
+        stake_percent=stake_percent,
         was_capped=was_capped,
         was_zeroed=was_zeroed
     )
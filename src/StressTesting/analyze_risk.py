@@ -19,29 +19,30 @@ def analyze_risk():
         print(f"Error: {RESULTS_FILE} not found.")
         return
 
-    df = pd.read_csv(RESULTS_FILE)
-    n_sims = len(df)
+    cols = pd.read_csv(RESULTS_FILE, usecols=["final_roi", "max_drawdown", "bankrupt", "total_bets"])
+    roi = cols["final_roi"].to_numpy(np.float64)
+    dd = cols["max_drawdown"].to_numpy(np.float64)
+    bankrupt = cols["bankrupt"].to_numpy(bool)
+    bets = cols["total_bets"].to_numpy(np.float64)
+    n_sims = len(roi)
     
     # 1. Ruin Analysis
-    ruin_count = df['bankrupt'].sum()
+    ruin_count = int(bankrupt.sum())
     ruin_prob = ruin_count / n_sims
     
-    # 2. Drawdown Analysis
-    avg_max_dd = df['max_drawdown'].mean()
-    median_max_dd = df['max_drawdown'].median()
-    p90_dd = np.percentile(df['max_drawdown'], 90)
-    p95_dd = np.percentile(df['max_drawdown'], 95)
-    p99_dd = np.percentile(df['max_drawdown'], 99)
-    worst_case_dd = df['max_drawdown'].max()
+    # 2. Drawdown Analysis (one sort for every percentile)
+    avg_max_dd = dd.mean()
+    median_max_dd, p90_dd, p95_dd, p99_dd = np.percentile(dd, [50, 90, 95, 99])
+    worst_case_dd = dd.max()
     
     # 3. ROI Analysis
-    avg_roi = df['final_roi'].mean()
-    median_roi = df['final_roi'].median()
-    std_roi = df['final_roi'].std()
+    avg_roi = roi.mean()
+    median_roi = np.median(roi)
+    std_roi = roi.std(ddof=1) # Sample std, as pandas computed it
     sharpe_proxy = avg_roi / std_roi if std_roi > 0 else 0
     
     # 4. Bets Analysis
-    avg_bets = df['total_bets'].mean()
+    avg_bets = bets.mean()
     
     # Classification
     if ruin_prob > 0.05: risk_level = "UNACCEPTABLE"
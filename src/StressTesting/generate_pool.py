@@ -63,52 +63,46 @@ def generate_pool():
     
     X, y = prepare_features(df)
     
-    # Predict all
-    dmatrix = xgb.DMatrix(X)
-    probs = model.predict(dmatrix)
+    # Predict all straight from the NumPy buffer; XGBoost works in float32 internally
+    probs = model.inplace_predict(np.ascontiguousarray(X, dtype=np.float32))
     if len(probs.shape) == 2:
         probs = probs[:, 1]
     
     # Validation period (last ~11 seasons)
-    pool = []
+    rng = np.random.default_rng(42) # PCG64, seeded for reproducible noise
     
-    np.random.seed(42) # For reproducible noise
+    # Synthetic Market Odds Simulation, vectorized over every game.
+    # To verify the strategy, we need to simulate a market that the model disagrees with.
+    # We assume the Market is "Good but slightly worse/different" than our model.
+    # Logic: Market Prob = Model Prob + Noise + Regression to Mean
     
-    for prob, outcome in zip(probs, y):
-        # Synthetic Market Odds Simulation
-        # To verify the strategy, we need to simulate a market that the model disagrees with.
-        # We assume the Market is "Good but slightly worse/different" than our model.
-        # Logic: Market Prob = Model Prob + Noise + Regression to Mean
-        
-        # 1. Regress model prob towards 0.5 (Market is often more conservative or misses "sharp" edges)
-        # However, sometimes market is sharper.
-        # Let's add random noise to simulate disagreement.
-        # Noise std dev = 0.05 (5%)
-        noise = np.random.normal(0, 0.05)
-        
-        # Market estimation of true prob
-        market_fair_prob = np.clip(prob + noise, 0.05, 0.95)
-        
-        # 2. Add vig (margin)
-        market_prob_home_vig = min(0.99, market_fair_prob + (BOOKMAKER_MARGIN / 2))
-        market_prob_away_vig = min(0.99, (1 - market_fair_prob) + (BOOKMAKER_MARGIN / 2))
-        
-        odds_home = 1.0 / market_prob_home_vig
-        odds_away = 1.0 / market_prob_away_vig
-        
-        # Model considers 'prob' as the True Probability.
-        # It calculates EV against 'odds_home' or 'odds_away'.
-        
-        pool.append({
-            "prob_home": round(prob, 4),
-            "odds_home": round(odds_home, 4),
-            "prob_away": round(1.0 - prob, 4),
-            "odds_away": round(odds_away, 4),
-            "outcome_home": int(outcome), # 1 if Home Won
-        })
+    # 1. Regress model prob towards 0.5 (Market is often more conservative or misses "sharp" edges)
+    # However, sometimes market is sharper.
+    # Let's add random noise to simulate disagreement.
+    # Noise std dev = 0.05 (5%)
+    noise = rng.normal(0.0, 0.05, size=probs.shape)
+    
+    # Market estimation of true prob
+    market_fair_prob = np.clip(probs + noise, 0.05, 0.95)
+    
+    # 2. Add vig (margin)
+    market_prob_home_vig = np.minimum(0.99, market_fair_prob + (BOOKMAKER_MARGIN / 2))
+    market_prob_away_vig = np.minimum(0.99, (1 - market_fair_prob) + (BOOKMAKER_MARGIN / 2))
+    
+    odds_home = 1.0 / market_prob_home_vig
+    odds_away = 1.0 / market_prob_away_vig
+    
+    # Model considers 'prob' as the True Probability.
+    # It calculates EV against 'odds_home' or 'odds_away'.
+    pool_df = pd.DataFrame({
+        "prob_home": probs.round(4),
+        "odds_home": odds_home.round(4),
+        "prob_away": (1.0 - probs).round(4),
+        "odds_away": odds_away.round(4),
+        "outcome_home": y.astype(np.int8), # 1 if Home Won
+    })
         
     # Save to CSV
-    pool_df = pd.DataFrame(pool)
     output_path = OUTPUT_DIR / "simulation_pool.csv"
     pool_df.to_csv(output_path, index=False)
     print(f"Generated pool with {len(pool_df)} games: {output_path}")
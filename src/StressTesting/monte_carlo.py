@@ -15,13 +15,25 @@ from pathlib import Path
 from tqdm import tqdm
 import multiprocessing
 from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+
+# Optional JIT for the season kernel; without numba it runs as plain Python
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
 
 # Project path
 sys.path.append(str(Path(__file__).resolve().parents[2]))
 
-from src.EVEngine.ev_calculator import calculate_ev
-from src.RiskFilter.filter import RiskFilter, SeasonPhase
-from src.StakeEngine.calculator import calculate_stake
+from src.RiskFilter.filter import SeasonPhase
 from src.StakeEngine import config as stake_config
 from src.RiskFilter import config as risk_config
 
@@ -30,144 +42,337 @@ N_SIMULATIONS = 10000
 GAMES_PER_SEASON = 1230 # Full NBA regular season
 INITIAL_BANKROLL = 100.0
 RUIN_THRESHOLD = 10.0 # Considered "broke" if below 10 units
+BASE_SEED = 42 # Root of the per-season RNG streams (season i uses child stream i)
+SEASON_BATCH = 256 # Seasons simulated in lockstep per task when numba is unavailable
+
+# Fields of one season's result tuple / one row of the results array
+RESULT_COLUMNS = ["final_roi", "max_drawdown", "bankrupt", "total_bets", "final_bankroll"]
 
 POOL_FILE = Path(__file__).parent / "simulation_pool.csv"
 OUTPUT_DIR = Path(__file__).parents[2] / "validation_results" / "monte_carlo"
 
-def run_single_season(args):
+# Phase order used by the kernel's integer phase index
+PHASES = (SeasonPhase.EARLY, SeasonPhase.MID, SeasonPhase.PRE_DEADLINE, SeasonPhase.LATE)
+
+# Phase index of every game number, by season progress: <25% early, <60% mid, <75% pre-deadline, else late.
+# Identical for all seasons, so computed once instead of per game per season.
+PHASE_IDX = np.digitize(np.arange(GAMES_PER_SEASON) / GAMES_PER_SEASON, [0.25, 0.60, 0.75]).astype(np.int8)
+
+# RiskFilter / StakeEngine constants, read once. The jitted kernels take them as
+# arguments: numba would freeze globals from other modules into its on-disk
+# cache, which is only invalidated when this file changes
+DEAD_ZONE_LOW, DEAD_ZONE_HIGH = risk_config.PROBABILITY_DEAD_ZONE
+MIN_PROBABILITY = risk_config.MIN_PROBABILITY
+MAX_STAKE_PERCENT = stake_config.MAX_STAKE_PERCENT
+MIN_STAKE_UNITS = stake_config.MIN_STAKE_UNITS
+
+# Simulation pool as Structure-of-Arrays, set per process by init_pool
+_POOL_PROB = None
+_POOL_ODDS = None
+_POOL_OUTCOME = None
+# SharedMemory handles backing the pool views in a worker (kept alive here)
+_POOL_SHM = []
+
+# Pool columns are stored compactly: 4-decimal probabilities and odds fit float32
+POOL_DTYPES = {"prob_home": np.float32, "odds_home": np.float32, "outcome_home": np.int8}
+
+def load_pool(pool_file=POOL_FILE):
+    """Read the pool CSV into (prob_home, odds_home, outcome_home) column arrays."""
+    pool_df = pd.read_csv(pool_file, usecols=list(POOL_DTYPES), dtype=POOL_DTYPES)
+    return tuple(pool_df[col].to_numpy() for col in POOL_DTYPES)
+
+def init_pool(pool_prob, pool_odds, pool_outcome):
+    """Install the pool arrays in this process (also used as the worker initializer)."""
+    global _POOL_PROB, _POOL_ODDS, _POOL_OUTCOME
+    _POOL_PROB, _POOL_ODDS, _POOL_OUTCOME = pool_prob, pool_odds, pool_outcome
+
+@contextmanager
+def shared_pool(pool):
     """
-    Simulate one season (1230 games).
-    Args is a tuple/dict containing: (pool_sample, params)
-    Returns: {final_roi, max_drawdown, bankrupt, total_bets}
+    Copy the pool arrays into SharedMemory blocks for the duration of the block.
+    Yields the (name, shape, dtype) specs that attach_pool maps in each worker.
+    """
+    blocks = []
+    try:
+        specs = []
+        for arr in pool:
+            shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+            blocks.append(shm)
+            np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[:] = arr
+            specs.append((shm.name, arr.shape, arr.dtype.str))
+        yield tuple(specs)
+    finally:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+
+def attach_pool(specs):
+    """Worker initializer: map the shared pool blocks as read-only arrays."""
+    global _POOL_SHM
+    _POOL_SHM = [shared_memory.SharedMemory(name=name) for name, _, _ in specs]
+    arrays = []
+    for shm, (_, shape, dtype) in zip(_POOL_SHM, specs):
+        arr = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        arr.flags.writeable = False
+        arrays.append(arr)
+    init_pool(*arrays)
+
+def _aggressiveness_by_phase():
+    """
+    Aggressiveness per PHASES entry as RiskFilter.validate would return it for
+    an otherwise allowed bet. 0.0 marks a phase the filter blocks.
+    """
+    table = np.full(len(PHASES), risk_config.AGGRESSIVENESS_NORMAL, dtype=np.float64)
+    if risk_config.BLOCK_EARLY_SEASON:
+        table[0] = 0.0
+    if risk_config.REDUCE_PRE_TRADE_DEADLINE:
+        table[2] = risk_config.AGGRESSIVENESS_PRE_DEADLINE
+    return table
+
+# Same for every season and scenario, so built once per process instead of
+# from a fresh RiskFilter per season
+AGGR_BY_PHASE = _aggressiveness_by_phase()
+
+@njit(cache=True)
+def validate_nb(p, ev, phase_idx, min_ev, aggr_by_phase, dead_zone_low, dead_zone_high, min_probability):
+    """RiskFilter.validate as plain arithmetic. Returns (allowed, aggressiveness)."""
+    aggressiveness = aggr_by_phase[phase_idx]
+    allowed = (
+        ev > 0
+        and not (dead_zone_low <= p < dead_zone_high)
+        and p >= min_probability
+        and ev >= min_ev
+        and aggressiveness > 0.0
+    )
+    return allowed, aggressiveness
+
+# Pinned signature: compiled eagerly at import and serialized by cache=True, so
+# only the first process on a host pays the compile; workers load it from __pycache__
+_SEASON_KERNEL_SIG = (
+    "(float64[::1], float64[::1], float64[::1], int8[::1], int8[::1], "
+    "float64, float64, float64[::1], float64, float64, float64, float64, float64)"
+)
+
+@njit(_SEASON_KERNEL_SIG, cache=True, fastmath=True)
+def _simulate_season_nb(p_seen, ev_seen, odds, outcome, phase_idx, fractional_kelly, min_ev, aggr_by_phase,
+                        dead_zone_low, dead_zone_high, min_probability, max_stake_percent, min_stake_units):
+    """
+    Per-game season loop with RiskFilter.validate and calculate_stake inlined
+    as plain arithmetic. p_seen/ev_seen are the bias-adjusted probability and EV
+    computed up front by _seen_arrays; the config thresholds come in as
+    arguments (see DEAD_ZONE_LOW above).
+    Returns (roi, max_drawdown, bankrupt, total_bets, final_bankroll).
     """
-    pool_sample, params = args
-    
-    # Default parameters if not provided
-    fractional_kelly = params.get('fractional_kelly', 0.25)
-    prob_bias = params.get('prob_bias', 0.0) # e.g. -0.05 for 5% overestimation of true prob
-    ev_threshold = params.get('min_ev', 0.03) # Default from config
-    
     bankroll = INITIAL_BANKROLL
     peak_bankroll = INITIAL_BANKROLL
     max_drawdown = 0.0
     total_bets = 0
     
-    # Initialize engines
-    risk_filter = RiskFilter(min_ev=ev_threshold)
-    
-    indices = np.arange(len(pool_sample))
-    
-    for i, row in enumerate(pool_sample):
+    for i in range(p_seen.shape[0]):
         if bankroll < RUIN_THRESHOLD:
-            return {
-                "final_roi": -1.0, 
-                "max_drawdown": 1.0, 
-                "bankrupt": True,
-                "total_bets": total_bets,
-                "final_bankroll": bankroll
-            }
-            
-        progress_pct = i / GAMES_PER_SEASON
-        if progress_pct < 0.25: phase = SeasonPhase.EARLY
-        elif progress_pct < 0.60: phase = SeasonPhase.MID
-        elif progress_pct < 0.75: phase = SeasonPhase.PRE_DEADLINE
-        else: phase = SeasonPhase.LATE
+            return -1.0, 1.0, True, total_bets, bankroll
         
-        # Check Home Bet
-        p_model = row["prob_home"]
-        odds_home = row["odds_home"]
+        p = p_seen[i]
+        ev = ev_seen[i]
+        odds_home = odds[i]
         
-        # Simulate biases:
-        # If prob_bias is negative (e.g. -0.05), it means our model OVERESTIMATES.
-        # So the "True" probability (which decides the outcome) is lower.
-        # Wait, the pool (row['outcome_home']) is fixed based on historical data.
-        # The pool row already has 'outcome_home' derived from the actual game.
-        # So we can't change the outcome probability because the outcome is binary and fixed in history.
+        # RiskFilter rules
+        allowed, aggressiveness = validate_nb(
+            p, ev, phase_idx[i], min_ev, aggr_by_phase, dead_zone_low, dead_zone_high, min_probability
+        )
+        if not allowed:
+            continue
         
-        # However, we can simulate that the Model *thinks* P is higher/lower than it is.
-        # In this simulation, 'p_model' is what the RiskFilter/StakeEngine sees.
-        # The Outcome is fixed.
-        # If we want to simulate "Model is Wrong", we adjust p_model passed to engines,
-        # but the outcome remains tied to the original data (which implies the original p_model was somewhat accurate).
+        # Stake Engine (Kelly)
+        if odds_home <= 1.0:
+            continue
+        kelly = ev / (odds_home - 1)
+        if kelly <= 0:
+            continue
+        stake = bankroll * kelly * fractional_kelly * aggressiveness
+        max_stake_units = bankroll * max_stake_percent
+        if stake > max_stake_units:
+            stake = max_stake_units
+        if stake < min_stake_units:
+            continue
         
-        # Actually, a better way to test "Model Overestimation" is:
-        # The engine SEES (P + bias). The outcome occurs as per reality.
-        # So if bias=+0.05, we bet thinking P=0.60, but reality (outcome) reflects P=0.55.
+        total_bets += 1
+        # Resolve using FIXED outcome from history
+        if outcome[i] == 1:
+            bankroll += stake * (odds_home - 1)
+        else:
+            bankroll -= stake
         
-        p_seen = np.clip(p_model + prob_bias, 0.01, 0.99)
+        # Update metrics
+        if bankroll > peak_bankroll:
+            peak_bankroll = bankroll
         
-        # Calculate EV using SEEN probability
-        ev_seen = (p_seen * odds_home) - 1
+        dd = (peak_bankroll - bankroll) / peak_bankroll
+        if dd > max_drawdown:
+            max_drawdown = dd
+    
+    roi = (bankroll - INITIAL_BANKROLL) / INITIAL_BANKROLL
+    return roi, max_drawdown, False, total_bets, bankroll
+
+def _gather(sample_indices):
+    """
+    The sampled games' (prob, odds, outcome). The pool is gathered in its
+    compact dtypes and widened to float64 only for the season's own games,
+    so the kernel and the NumPy batch path do their arithmetic identically.
+    """
+    return (
+        _POOL_PROB[sample_indices].astype(np.float64),
+        _POOL_ODDS[sample_indices].astype(np.float64),
+        _POOL_OUTCOME[sample_indices],
+    )
+
+def _seen_arrays(prob, odds, prob_bias):
+    """
+    What the engines SEE: (P + bias) and its EV, for a whole season at once.
+    The outcome stays as it happened, so a positive bias means we bet thinking
+    P=0.60 while reality reflects P=0.55.
+    """
+    p_seen = np.clip(prob + prob_bias, 0.01, 0.99)
+    return p_seen, (p_seen * odds) - 1
+
+def _sample_indices(season):
+    """
+    The season's game indices into the pool (with replacement). Each season
+    draws from its own child stream of SeedSequence(BASE_SEED), so results do
+    not depend on which worker simulates it.
+    """
+    rng = np.random.default_rng(np.random.SeedSequence(BASE_SEED, spawn_key=(season,)))
+    return rng.integers(0, len(_POOL_PROB), GAMES_PER_SEASON, dtype=np.int32)
+
+def run_season_batch(sample_indices_2d, params):
+    """
+    Simulate K seasons in lockstep with NumPy, one vectorized step per game.
+    sample_indices_2d is a (K, games) array of pool indices.
+    Returns a (K, 5) float64 array with one RESULT_COLUMNS row per season.
+    """
+    fractional_kelly = params.get('fractional_kelly', 0.25)
+    prob_bias = params.get('prob_bias', 0.0)
+    ev_threshold = params.get('min_ev', 0.03)
+    
+    prob, odds, outcome = _gather(sample_indices_2d)
+    p_seen, ev_seen = _seen_arrays(prob, odds, prob_bias)
+    
+    # RiskFilter rules for every (season, game) in one pass
+    allowed = (
+        (ev_seen > 0)
+        & ~((p_seen >= DEAD_ZONE_LOW) & (p_seen < DEAD_ZONE_HIGH))
+        & (p_seen >= MIN_PROBABILITY)
+        & (ev_seen >= ev_threshold)
+        & (odds > 1.0)
+    )
+    # Kelly fraction (0 where blocked) and bankroll change per unit staked
+    kelly = np.where(allowed, ev_seen / np.where(allowed, odds - 1, 1.0), 0.0)
+    unit_profit = np.where(outcome == 1, odds - 1, -1.0)
+    aggr_by_game = AGGR_BY_PHASE[PHASE_IDX]
+    
+    k, n_games = sample_indices_2d.shape
+    # Bankroll after every game, column 0 holding the starting bankroll
+    trajectory = np.empty((k, n_games + 1))
+    trajectory[:, 0] = INITIAL_BANKROLL
+    bankroll = trajectory[:, 0].copy()
+    total_bets = np.zeros(k, dtype=np.int64)
+    alive = np.ones(k, dtype=bool)
+    
+    # Masks instead of branches: every season computes a stake each game and
+    # seasons that do not bet simply add 0.0 to their bankroll
+    for t in range(n_games):
+        # Ruined seasons stop betting; their bankroll stays frozen
+        alive &= bankroll >= RUIN_THRESHOLD
         
-        # Risk Filter acts on SEEN data
-        risk_decision = risk_filter.validate(p_seen, ev_seen, phase)
+        # Stake Engine (Kelly)
+        stake = np.minimum(bankroll * kelly[:, t] * fractional_kelly * aggr_by_game[t],
+                           bankroll * MAX_STAKE_PERCENT)
+        placed = alive & (stake >= MIN_STAKE_UNITS)
+        stake *= placed
         
-        if risk_decision.allowed:
-            # Calculate Stake using SEEN data
-            stake_res = calculate_stake(
-                p_seen, odds_home, bankroll, 
-                fractional_kelly=fractional_kelly, 
-                aggressiveness=risk_decision.aggressiveness
-            )
-            
-            stake = stake_res.recommended_stake
-            
-            if stake > 0:
-                total_bets += 1
-                # Resolve using FIXED outcome from history
-                if row["outcome_home"] == 1:
-                    profit = stake * (odds_home - 1)
-                    bankroll += profit
-                else:
-                    bankroll -= stake
-                
-                # Update metrics
-                if bankroll > peak_bankroll:
-                    peak_bankroll = bankroll
-                
-                dd = (peak_bankroll - bankroll) / peak_bankroll
-                if dd > max_drawdown:
-                    max_drawdown = dd
-                    
-    # End of season
-    roi = (bankroll - INITIAL_BANKROLL) / INITIAL_BANKROLL
+        total_bets += placed
+        bankroll += stake * unit_profit[:, t]
+        trajectory[:, t + 1] = bankroll
     
-    return {
-        "final_roi": roi,
-        "max_drawdown": max_drawdown,
-        "bankrupt": False,
-        "total_bets": total_bets,
-        "final_bankroll": bankroll
-    }
+    # Drawdown bookkeeping after the fact: running peak, then the deepest dip below it
+    peaks = np.maximum.accumulate(trajectory, axis=1)
+    max_drawdown = ((peaks - trajectory) / peaks).max(axis=1)
+    
+    bankrupt = ~alive
+    return np.column_stack((
+        np.where(bankrupt, -1.0, (bankroll - INITIAL_BANKROLL) / INITIAL_BANKROLL),
+        np.where(bankrupt, 1.0, max_drawdown),
+        bankrupt,
+        total_bets,
+        bankroll,
+    )).astype(np.float64)
+
+def run_seed_batch(args):
+    """Worker entry for batch mode: (seasons, params) -> run_season_batch result."""
+    seasons, params = args
+    return run_season_batch(np.stack([_sample_indices(season) for season in seasons]), params)
+
+def run_single_season(args):
+    """
+    Simulate one season (1230 games).
+    Args is a tuple containing: (season, params). The season's games are drawn
+    with replacement from the pool installed by init_pool/attach_pool.
+    Returns: (final_roi, max_drawdown, bankrupt, total_bets, final_bankroll)
+    """
+    season, params = args
+    
+    # Default parameters if not provided
+    fractional_kelly = params.get('fractional_kelly', 0.25)
+    prob_bias = params.get('prob_bias', 0.0) # e.g. -0.05 for 5% overestimation of true prob
+    ev_threshold = params.get('min_ev', 0.03) # Default from config
+    
+    sample_indices = _sample_indices(season)
+    prob, odds, outcome = _gather(sample_indices)
+    p_seen, ev_seen = _seen_arrays(prob, odds, prob_bias)
+    
+    return _simulate_season_nb(
+        p_seen, ev_seen, odds, outcome, PHASE_IDX,
+        fractional_kelly, ev_threshold, AGGR_BY_PHASE,
+        DEAD_ZONE_LOW, DEAD_ZONE_HIGH, MIN_PROBABILITY, MAX_STAKE_PERCENT, MIN_STAKE_UNITS,
+    )
+
+def results_frame(results_arr):
+    """Results array -> DataFrame with the original column dtypes."""
+    return pd.DataFrame(results_arr, columns=RESULT_COLUMNS).astype({"bankrupt": bool, "total_bets": np.int64})
 
 def main():
     print(f"Loading pool from {POOL_FILE}...")
-    pool_df = pd.read_csv(POOL_FILE)
-    pool_records = pool_df.to_dict('records')
+    pool = load_pool(POOL_FILE)
     
     print(f"Starting {N_SIMULATIONS} simulations (Monte Carlo)...")
     
-    # Prepare tasks: random samples of the pool
-    tasks = []
-    np.random.seed(42) # Reproducibility
-    
-    for _ in range(N_SIMULATIONS):
-        # Sample with replacement
-        sample_indices = np.random.randint(0, len(pool_records), size=GAMES_PER_SEASON)
-        sample = [pool_records[i] for i in sample_indices]
-        tasks.append(sample)
+    # Prepare tasks: one season index each, workers sample the shared pool (Reproducibility)
+    tasks = [(i, {}) for i in range(N_SIMULATIONS)]
     
-    # Run in parallel
-    results = []
+    # Run in parallel, filling a preallocated row per season as results arrive
+    results_arr = np.empty((N_SIMULATIONS, len(RESULT_COLUMNS)), dtype=np.float64)
     # For large N, use ProcessPool. For Debug N=100, linear is fine.
     # Using 80% of CPU
     max_workers = max(1, multiprocessing.cpu_count() - 1)
     
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        results = list(tqdm(executor.map(run_single_season, tasks), total=N_SIMULATIONS))
+    with shared_pool(pool) as specs, \
+            ProcessPoolExecutor(max_workers=max_workers, initializer=attach_pool, initargs=(specs,)) as executor:
+        if NUMBA_AVAILABLE:
+            # Several seasons per IPC round-trip; a jitted season takes ~ms
+            chunksize = max(1, len(tasks) // (max_workers * 8))
+            for i, row in enumerate(tqdm(executor.map(run_single_season, tasks, chunksize=chunksize), total=N_SIMULATIONS)):
+                results_arr[i] = row
+        else:
+            # Without the JIT kernel, simulate SEASON_BATCH seasons per vectorized task
+            batches = [
+                ([season for season, _ in tasks[i:i + SEASON_BATCH]], {})
+                for i in range(0, len(tasks), SEASON_BATCH)
+            ]
+            for i, block in enumerate(tqdm(executor.map(run_seed_batch, batches), total=len(batches))):
+                results_arr[i * SEASON_BATCH:i * SEASON_BATCH + len(block)] = block
         
     # Analyze
-    df_results = pd.DataFrame(results)
+    df_results = results_frame(results_arr)
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     df_results.to_csv(OUTPUT_DIR / "monte_carlo_results.csv", index=False)
     
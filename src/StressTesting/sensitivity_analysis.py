@@ -17,35 +17,26 @@ from concurrent.futures import ProcessPoolExecutor
 sys.path.append(str(Path(__file__).resolve().parents[2]))
 
 # Import refactored runner
-from src.StressTesting.monte_carlo import run_single_season, GAMES_PER_SEASON
+from src.StressTesting.monte_carlo import run_single_season, attach_pool, load_pool, shared_pool, results_frame, RESULT_COLUMNS
 
 POOL_FILE = Path(__file__).parent / "simulation_pool.csv"
 OUTPUT_DIR = Path(__file__).parents[2] / "validation_results" / "sensitivity"
 
-def run_scenario(scenario_name, params, n_sims=500):
-    """Run a batch of simulations for a specific scenario."""
+def run_scenario(scenario_name, params, executor, max_workers, n_sims=500):
+    """Run a batch of simulations for a specific scenario on a shared worker pool."""
     print(f"\n[SCENARIO] {scenario_name}")
     print(f"Params: {params}")
     
-    # Load data
-    pool_df = pd.read_csv(POOL_FILE)
-    pool_records = pool_df.to_dict('records')
-    
-    # Prepare tasks
-    tasks = []
-    np.random.seed(42) 
-    
-    for _ in range(n_sims):
-        sample_indices = np.random.randint(0, len(pool_records), size=GAMES_PER_SEASON)
-        sample = [pool_records[i] for i in sample_indices]
-        tasks.append((sample, params))
+    # Prepare tasks: same season indices in every scenario so they face identical seasons
+    tasks = [(i, params) for i in range(n_sims)]
         
     # Run
-    max_workers = max(1, multiprocessing.cpu_count() - 1)
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        results = list(tqdm(executor.map(run_single_season, tasks), total=n_sims, desc=scenario_name, leave=False))
+    results_arr = np.empty((n_sims, len(RESULT_COLUMNS)), dtype=np.float64)
+    chunksize = max(1, len(tasks) // (max_workers * 8))
+    for i, row in enumerate(tqdm(executor.map(run_single_season, tasks, chunksize=chunksize), total=n_sims, desc=scenario_name, leave=False)):
+        results_arr[i] = row
         
-    df = pd.DataFrame(results)
+    df = results_frame(results_arr)
     
     return {
         "scenario": scenario_name,
@@ -76,10 +67,15 @@ def main():
         ("Low Selectivity (EV>1%)",   {"min_ev": 0.01, "fractional_kelly": 0.25}),
     ]
     
+    # Pool and workers are set up once and shared by every scenario
+    pool = load_pool(POOL_FILE)
+    max_workers = max(1, multiprocessing.cpu_count() - 1)
     summary = []
-    for name, params in scenarios:
-        metrics = run_scenario(name, params, n_sims=500) # 500 sims per scenario for speed
-        summary.append(metrics)
+    with shared_pool(pool) as specs, \
+            ProcessPoolExecutor(max_workers=max_workers, initializer=attach_pool, initargs=(specs,)) as executor:
+        for name, params in scenarios:
+            metrics = run_scenario(name, params, executor, max_workers, n_sims=500) # 500 sims per scenario for speed
+            summary.append(metrics)
         
     # Generate Report
     report_df = pd.DataFrame(summary)
@@ -41,6 +41,17 @@ def get_json_data(url):
     return json.get('resultSets')
 
 
+async def get_json_data_async(client, url):
+    """Async variant of get_json_data for a shared httpx.AsyncClient."""
+    try:
+        raw_data = await client.get(url, headers=data_headers)
+        json = raw_data.json()
+    except Exception as e:
+        print(e)
+        return {}
+    return json.get('resultSets')
+
+
 def get_todays_games_json(url):
     raw_data = requests.get(url, headers=games_header)
     json = raw_data.json()
@@ -0,0 +1,26 @@
+"""
+Run every verify_*.py script in turn.
+Run from the repo root: python -m tests
+(one script: python -m tests.verify_risk_guard; unit tests: python -m pytest)
+"""
+import runpy
+import sys
+
+SCRIPTS = ("verify_bankroll_service", "verify_risk_guard", "verify_bet_pipeline")
+
+if __name__ == "__main__":
+    failed = []
+    for name in SCRIPTS:
+        print(f"\n=== tests.{name} ===")
+        try:
+            runpy.run_module(f"tests.{name}", run_name="__main__")
+        except SystemExit as e:
+            # verify_risk_guard's _check stops with SystemExit; exit 0 is a pass
+            if e.code not in (None, 0):
+                print(f"❌ tests.{name} failed: {e.code}")
+                failed.append(name)
+        except Exception as e:
+            print(f"❌ tests.{name} failed: {e!r}")
+            failed.append(name)
+    print(f"\n{len(SCRIPTS) - len(failed)}/{len(SCRIPTS)} verify scripts passed" + (f"; failed: {', '.join(failed)}" if failed else ""))
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,38 @@
+import unittest
+
+from src.BankrollEngine.service import BankrollService
+from src.Services.audit_logger import AuditLogger
+from src.Services.singletons import reset_singletons
+
+class TestAuditLogger(unittest.TestCase):
+    def setUp(self):
+        self.svc = BankrollService.reset_for_testing(":memory:")
+        self.audit = AuditLogger()
+
+    def tearDown(self):
+        self.audit.close()
+        reset_singletons()
+
+    def _events(self):
+        with self.svc.connect() as con:
+            return con.execute("SELECT event_type, game_id FROM audit_log ORDER BY id").fetchall()
+
+    def test_events_written_on_flush(self):
+        self.audit.log_bet_taken("GAME_001", 1.5, 0.05)
+        self.audit.log_bet_blocked("GAME_002", "Early Season")
+        self.audit.flush()
+        self.assertEqual(self._events(), [("BET_TAKEN", "GAME_001"), ("BET_BLOCKED", "GAME_002")])
+
+    def test_failed_batch_is_dropped_and_writer_survives(self):
+        # details is NOT NULL: this batch fails and must not stop the writer
+        with self.assertLogs("AuditLogger", level="ERROR"):
+            self.audit.log("BET_BLOCKED", "GAME_001", details=None)
+            self.audit.flush()
+        self.assertTrue(self.audit._thread.is_alive())
+
+        self.audit.log_bet_blocked("GAME_002", "Circuit Breaker")
+        self.audit.flush()
+        self.assertEqual(self._events(), [("BET_BLOCKED", "GAME_002")])
+
+if __name__ == '__main__':
+    unittest.main()
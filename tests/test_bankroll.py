@@ -1,30 +1,30 @@
 import unittest
-import os
-import sys
-from pathlib import Path
-
-# Add project root to path
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+import sqlite3
 
 from src.BankrollEngine.manager import BankrollManager
 from src.BankrollEngine.models import BankrollState
 
-# Temporary DB for testing
-TEST_DB = "test_bankroll.sqlite"
+# Throwaway DBs need no durability
+TEST_PRAGMAS = {"journal_mode": "MEMORY", "synchronous": "OFF", "temp_store": "MEMORY"}
 
 class TestBankrollManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # One in-memory DB and schema for the whole class
+        cls.con = sqlite3.connect(":memory:", check_same_thread=False)
+        cls.manager = BankrollManager(connection=cls.con)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.con.close()
+
     def setUp(self):
-        import uuid
-        self.test_db = f"test_bankroll_{uuid.uuid4().hex}.sqlite"
-        self.manager = BankrollManager(db_path=self.test_db)
+        # Every test's writes are rolled back in tearDown
+        self.con.execute("SAVEPOINT test_sp")
 
     def tearDown(self):
-        if os.path.exists(self.test_db):
-            try:
-                os.remove(self.test_db)
-            except PermissionError:
-                print(f"Warning: Could not remove {self.test_db}")
-                pass
+        self.con.execute("ROLLBACK TO test_sp")
+        self.con.execute("RELEASE test_sp")
 
     def test_initialization(self):
         state = self.manager.get_state()
@@ -56,6 +56,43 @@ class TestBankrollManager(unittest.TestCase):
         self.assertEqual(state.initial_units, 500.0)
         self.assertEqual(state.max_drawdown, 0.0)
 
+    def test_update_batch_matches_sequential(self):
+        results = [("LOSS", 25.0), ("WIN", 10.0, 15.0), ("PUSH", 1.0)] + [("LOSS", 1.0)] * 10
+        balance = self.manager.update_bankroll_batch(results)
+        state = self.manager.get_state()
+        self.assertAlmostEqual(balance, 80.0)
+        self.assertAlmostEqual(state.current_units, 80.0)
+        self.assertEqual(state.peak_units, 100.0)
+        # Deepest point was after the first loss: (100 - 75) / 100
+        self.assertAlmostEqual(state.max_drawdown, 0.25, places=4)
+        self.assertEqual(self.manager.calculate_performance()["total_bets"], 12)
+
+        # The same results one update_bankroll call at a time, on a second manager
+        con = sqlite3.connect(":memory:")
+        try:
+            sequential = BankrollManager(connection=con)
+            for item in results:
+                sequential.update_bankroll(*item)
+            self.assertEqual(
+                sequential.get_state().model_dump(exclude={"last_updated"}),
+                state.model_dump(exclude={"last_updated"}),
+            )
+            ledger = "SELECT type, amount, balance_after, note FROM transactions ORDER BY id"
+            self.assertEqual(con.execute(ledger).fetchall(), self.con.execute(ledger).fetchall())
+        finally:
+            con.close()
+
+    def test_update_batch_rejects_invalid_result(self):
+        with self.assertRaises(ValueError):
+            self.manager.update_bankroll_batch([("LOSS", 1.0), ("DRAW", 1.0)])
+        self.assertEqual(self.manager.get_state().current_units, 100.0)
+
+    def test_memory_uri_is_shared(self):
+        uri = f"file:{self.id()}?mode=memory&cache=shared"
+        writer = BankrollManager(db_path=uri, pragmas=TEST_PRAGMAS)
+        writer.update_bankroll(result="LOSS", stake_units=5.0)
+        self.assertEqual(BankrollManager(db_path=uri, pragmas=TEST_PRAGMAS).get_state().current_units, 95.0)
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,151 @@
+import unittest
+import sqlite3
+import tempfile
+from pathlib import Path
+
+from src.BankrollEngine.service import BankrollService
+from src.Services.singletons import reset_singletons
+
+class TestBankrollService(unittest.TestCase):
+    def setUp(self):
+        # Fresh in-memory DB per test
+        self.svc = BankrollService.reset_for_testing(":memory:")
+
+    def tearDown(self):
+        reset_singletons()
+
+    def test_memory_db_initialization(self):
+        state = self.svc.get_state()
+        self.assertEqual(state.current_units, 100.0)
+        self.assertEqual(state.peak_units, 100.0)
+        self.assertEqual(state.status, "ACTIVE")
+        self.assertEqual(state.kelly_fraction, 0.25)
+
+    def test_peak_tracks_wins(self):
+        self.svc.update_bankroll("WIN", 5.0, profit_units=5.0)
+        self.svc.update_bankroll("LOSS", 3.0)
+        state = self.svc.get_state()
+        self.assertEqual(state.current_units, 102.0)
+        self.assertEqual(state.peak_units, 105.0)
+        self.assertAlmostEqual(state.max_drawdown, 3.0 / 105.0)
+
+    def test_observability_metrics(self):
+        self.svc.update_bankroll("WIN", 10.0, profit_units=10.0)
+        metrics = self.svc.get_observability_metrics()
+        self.assertEqual(metrics["peak_bankroll"], 110.0)
+        self.assertEqual(metrics["current_units"], 110.0)
+        self.assertEqual(metrics["blocked_bets"], 0)
+
+    def test_reset_yields_initial_state(self):
+        initial = self.svc.get_state()
+        self.svc.update_bankroll("LOSS", 30.0)
+        self.assertEqual(self.svc.operational_status, "DEGRADED")
+
+        self.svc = BankrollService.reset_for_testing(":memory:")
+        state = self.svc.get_state()
+        self.assertEqual(state.model_dump(exclude={"last_updated"}),
+                         initial.model_dump(exclude={"last_updated"}))
+        self.assertEqual(self.svc.operational_status, "ACTIVE")
+
+    def test_reset_to_bound_memory_db_keeps_it(self):
+        self.svc.update_bankroll("LOSS", 30.0)
+        keepalive = self.svc._keepalive
+
+        svc = BankrollService.reset_for_testing(self.svc.db_path)
+        self.assertIs(svc._keepalive, keepalive)
+        self.assertEqual(svc.get_state().current_units, 70.0)
+
+    def test_force_status_on_memory_db(self):
+        self.svc.force_status("PAUSED")
+        state = self.svc.get_state()
+        self.assertEqual((state.status, state.kelly_fraction), ("PAUSED", 0.0))
+        with self.svc.connect() as con:
+            note = con.execute("SELECT note FROM transactions").fetchone()[0]
+        self.assertEqual(note, "TEST_SEAM: status ACTIVE -> PAUSED")
+        with self.assertRaises(ValueError):
+            self.svc.force_status("BROKEN")
+
+    def test_force_status_refused_on_file_db(self):
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as td:
+            svc = BankrollService.reset_for_testing(Path(td) / "Bankroll.sqlite")
+            with self.assertRaises(RuntimeError):
+                svc.force_status("PAUSED")
+            self.assertEqual(svc.get_state().status, "ACTIVE")
+            with svc.connect() as con:
+                self.assertEqual(con.execute("SELECT COUNT(*) FROM transactions").fetchone()[0], 0)
+
+    def test_reset_singletons_closes_memory_db(self):
+        keepalive = self.svc._keepalive
+        reset_singletons()
+        with self.assertRaises(sqlite3.ProgrammingError):
+            keepalive.execute("SELECT 1")
+        self.assertIsNone(BankrollService._instance)
+
+    def _snapshot(self):
+        state = self.svc.get_state()
+        with self.svc.connect() as con:
+            ledger = con.execute(
+                "SELECT type, amount, balance_after, note, expected_value FROM transactions ORDER BY id"
+            ).fetchall()
+        return (state.current_units, state.peak_units, state.max_drawdown,
+                state.status, state.kelly_fraction), ledger
+
+    def test_batch_matches_sequential(self):
+        # Degrades, recovers, pauses on 10 straight losses, then one ignored win
+        results = [("LOSS", 25.0, 0.0, "big loss", 0.02),
+                   ("WIN", 15.0, 15.0, None, 0.05),
+                   ("PUSH", 2.0)]
+        results += [("LOSS", 1.0)] * 10 + [("WIN", 1.0, 1.0)]
+
+        for item in results:
+            self.svc.update_bankroll(*item)
+        sequential = self._snapshot()
+
+        self.svc = BankrollService.reset_for_testing(":memory:")
+        self.svc.update_bankroll_batch(results)
+        batched = self._snapshot()
+
+        self.assertEqual(sequential[0][3], "PAUSED")
+        self.assertEqual(len(sequential[1]), len(results) - 1)
+        self.assertEqual(batched, sequential)
+
+    def test_synchronous_normal_only_in_wal(self):
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as td:
+            legacy = Path(td) / "Legacy.sqlite"
+            sqlite3.connect(legacy).close()  # pre-existing rollback-journal file
+            for db, mode, synchronous in ((legacy, "delete", 2), (Path(td) / "New.sqlite", "wal", 1)):
+                svc = BankrollService.reset_for_testing(db)
+                con = svc.connect()
+                self.assertEqual(con.execute("PRAGMA journal_mode").fetchone()[0], mode)
+                self.assertEqual(con.execute("PRAGMA synchronous").fetchone()[0], synchronous)
+                con.close()
+
+    def test_legacy_peak_column_renamed(self):
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as td:
+            db = Path(td) / "Legacy.sqlite"
+            with sqlite3.connect(db) as con:
+                con.execute("""
+                    CREATE TABLE bankroll_state (
+                        id INTEGER PRIMARY KEY CHECK (id = 1),
+                        current_units REAL NOT NULL,
+                        initial_units REAL NOT NULL,
+                        peak_bankroll REAL NOT NULL,
+                        max_drawdown REAL NOT NULL DEFAULT 0.0,
+                        kelly_fraction REAL NOT NULL DEFAULT 0.25,
+                        status TEXT NOT NULL DEFAULT 'ACTIVE',
+                        last_updated DATETIME DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                con.execute("""
+                    INSERT INTO bankroll_state (id, current_units, initial_units, peak_bankroll)
+                    VALUES (1, 90.0, 100.0, 120.0)
+                """)
+            con.close()
+
+            svc = BankrollService.reset_for_testing(db)
+            self.assertEqual(svc.get_state().peak_units, 120.0)
+            svc.update_bankroll("WIN", 40.0, profit_units=40.0)
+            self.assertEqual(svc.get_state().peak_units, 130.0)
+
+if __name__ == '__main__':
+    unittest.main()
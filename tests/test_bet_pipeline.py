@@ -0,0 +1,64 @@
+import unittest
+from datetime import datetime
+
+import pandas as pd
+
+from src.BankrollEngine.service import BankrollService
+from src.Services.bet_pipeline import BetPipeline
+from src.Services.singletons import reset_singletons
+
+MID_SEASON_DATE = datetime(2026, 1, 15)
+EARLY_SEASON_DATE = datetime(2025, 10, 20)
+PRE_DEADLINE_DATE = datetime(2026, 2, 10)
+
+class TestBatchProcess(unittest.TestCase):
+    def setUp(self):
+        self.svc = BankrollService.reset_for_testing(":memory:")
+        self.pipeline = BetPipeline()
+
+    def tearDown(self):
+        reset_singletons()
+
+    def _games(self):
+        rows = [
+            (1.20, 2.00, MID_SEASON_DATE),      # invalid probability
+            (0.60, 1.00, MID_SEASON_DATE),      # invalid odds
+            (0.51, 1.90, MID_SEASON_DATE),      # negative EV
+            (0.60, 2.00, EARLY_SEASON_DATE),    # early season
+            (0.52, 2.20, MID_SEASON_DATE),      # dead zone
+            (0.45, 2.50, MID_SEASON_DATE),      # below min probability
+            (0.60, 1.70, MID_SEASON_DATE),      # EV below min
+            (0.60, 2.00, MID_SEASON_DATE),      # bet
+            (0.60, 2.00, PRE_DEADLINE_DATE),    # reduced bet
+        ]
+        return pd.DataFrame(
+            [(f"GAME_{i}", p, o, d) for i, (p, o, d) in enumerate(rows)],
+            columns=["game_id", "probability", "odds", "game_date"],
+        )
+
+    def _assert_matches_scalar(self, games):
+        batch = self.pipeline.batch_process(games)
+        for row, b in zip(games.itertuples(index=False), batch.itertuples(index=False)):
+            d = self.pipeline.process_bet(row.game_id, row.probability, row.odds, row.game_date)
+            with self.subTest(game_id=row.game_id):
+                self.assertEqual(b.decision, d.decision)
+                self.assertAlmostEqual(b.stake_units, d.stake_units)
+                if d.decision != "PASS":
+                    # PASS reasons carry formatted values only on the scalar path
+                    self.assertEqual(b.reason, d.reason)
+        return batch
+
+    def test_batch_matches_process_bet(self):
+        batch = self._assert_matches_scalar(self._games())
+        self.assertEqual(
+            batch["decision"].tolist(),
+            ["PASS", "PASS", "PASS", "BLOCKED", "BLOCKED", "BLOCKED", "BLOCKED", "BET", "BET"],
+        )
+
+    def test_batch_matches_process_bet_while_paused(self):
+        self.svc.force_status("PAUSED")
+        batch = self._assert_matches_scalar(self._games())
+        self.assertEqual(batch["decision"].tolist()[3:], ["BLOCKED"] * 6)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,49 +1,61 @@
 import unittest
-import sys
-from pathlib import Path
 
-# Add project root to path
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+import numpy as np
 
-from src.EVEngine.ev_calculator import calculate_ev, EVResult
+from src.EVEngine.ev_calculator import calculate_ev, calculate_ev_batch, EVResult
+
+# (probability, odds, expected EV, is_value_bet)
+EV_CASES = [
+    (0.55, 2.00, 0.10, True),    # 55% at 2.00 => +10%
+    (0.45, 2.00, -0.10, False),  # 45% at 2.00 => -10%
+    (0.50, 2.00, 0.00, False),   # break-even is not value: STRICT > 0
+    (0.30, 4.00, 0.20, True),    # (0.3 * 4) - 1 = +20%
+]
+
+# (probability, odds) pairs calculate_ev must reject
+INVALID_INPUTS = [
+    (1.5, 2.0),
+    (-0.1, 2.0),
+    (0.5, 1.0),  # Odds must be > 1
+    (0.5, 0.9),
+]
 
 class TestEVCalculator(unittest.TestCase):
     
-    def test_positive_ev(self):
-        # 55% prob, 2.00 odds => EV = 0.10 (10%)
+    def test_ev_cases(self):
+        for probability, odds, expected_ev, is_value in EV_CASES:
+            with self.subTest(probability=probability, odds=odds):
+                result = calculate_ev(probability, odds)
+                self.assertAlmostEqual(result.ev, expected_ev)
+                self.assertEqual(result.is_value_bet, is_value)
+
+    def test_invalid_inputs(self):
+        for probability, odds in INVALID_INPUTS:
+            with self.subTest(probability=probability, odds=odds):
+                with self.assertRaises(ValueError):
+                    calculate_ev(probability, odds)
+
+    def test_result_converts_to_model(self):
         result = calculate_ev(0.55, 2.00)
-        self.assertAlmostEqual(result.ev, 0.10)
-        self.assertTrue(result.is_value_bet)
-
-    def test_negative_ev(self):
-        # 45% prob, 2.00 odds => EV = -0.10 (-10%)
-        result = calculate_ev(0.45, 2.00)
-        self.assertAlmostEqual(result.ev, -0.10)
-        self.assertFalse(result.is_value_bet)
-
-    def test_neutral_ev(self):
-        # 50% prob, 2.00 odds => EV = 0.00
-        result = calculate_ev(0.50, 2.00)
-        self.assertAlmostEqual(result.ev, 0.00)
-        self.assertFalse(result.is_value_bet) # STRICT > 0
-
-    def test_high_odds_value(self):
-        # 30% prob, 4.00 odds => EV = (0.3 * 4) - 1 = 1.2 - 1 = 0.2
-        result = calculate_ev(0.30, 4.00)
-        self.assertAlmostEqual(result.ev, 0.20)
-        self.assertTrue(result.is_value_bet)
-
-    def test_invalid_probability(self):
-        with self.assertRaises(ValueError):
-            calculate_ev(1.5, 2.0)
-        with self.assertRaises(ValueError):
-            calculate_ev(-0.1, 2.0)
-
-    def test_invalid_odds(self):
-        with self.assertRaises(ValueError):
-            calculate_ev(0.5, 1.0) # Odds must be > 1
-        with self.assertRaises(ValueError):
-            calculate_ev(0.5, 0.9)
+        model = result.to_model()
+        self.assertEqual(model.probability, 0.55)
+        self.assertEqual(model.is_value_bet, result.is_value_bet)
+
+    def test_batch_ev(self):
+        # Same cases as the scalar tests, computed in one call
+        probabilities, odds, expected_ev, is_value = map(list, zip(*EV_CASES))
+        ev, value_mask = calculate_ev_batch(np.array(probabilities), np.array(odds))
+        np.testing.assert_allclose(ev, expected_ev, atol=1e-9)
+        self.assertEqual(value_mask.tolist(), is_value)
+
+    def test_batch_matches_scalar(self):
+        rng = np.random.default_rng(0)
+        probabilities = rng.uniform(0.0, 1.0, 10_000)
+        odds = rng.uniform(1.01, 10.0, 10_000)
+        ev, value_mask = calculate_ev_batch(probabilities, odds)
+        scalar = [calculate_ev(p, o) for p, o in zip(probabilities, odds)]
+        np.testing.assert_allclose(ev, [r.ev for r in scalar])
+        self.assertEqual(value_mask.tolist(), [r.is_value_bet for r in scalar])
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from src.StressTesting import monte_carlo as mc
+
+SEASONS = list(range(6))
+
+class TestSeasonSimulators(unittest.TestCase):
+    """run_seed_batch (NumPy lockstep) must reproduce run_single_season (kernel)."""
+
+    def setUp(self):
+        self._init_pool(win_rate=0.55)
+        self.addCleanup(mc.init_pool, None, None, None)
+
+    def _init_pool(self, win_rate):
+        # Small synthetic pool; the season seeds come from BASE_SEED as in main()
+        rng = np.random.default_rng(7)
+        n = 400
+        mc.init_pool(
+            rng.uniform(0.40, 0.80, n).astype(np.float32),
+            rng.uniform(1.50, 2.60, n).astype(np.float32),
+            (rng.random(n) < win_rate).astype(np.int8),
+        )
+
+    def _assert_paths_match(self, params):
+        single = np.array([mc.run_single_season((season, params)) for season in SEASONS], dtype=np.float64)
+        batch = mc.run_seed_batch((SEASONS, params))
+        self.assertGreater(single[:, 3].sum(), 0)
+        np.testing.assert_array_equal(batch[:, 2:4], single[:, 2:4])  # bankrupt, total_bets
+        np.testing.assert_allclose(batch, single, rtol=1e-9, atol=1e-9)
+        return single
+
+    def test_default_params(self):
+        self._assert_paths_match({})
+
+    def test_biased_aggressive_params(self):
+        # Overconfident model at full Kelly on a losing pool: every season is ruined
+        self._init_pool(win_rate=0.35)
+        results = self._assert_paths_match({"fractional_kelly": 1.0, "prob_bias": 0.08, "min_ev": 0.01})
+        self.assertTrue(results[:, 2].all())
+
+    def test_config_threshold_reaches_both_paths(self):
+        baseline = self._assert_paths_match({})
+        with patch.object(mc, "MIN_PROBABILITY", 0.75):
+            stricter = self._assert_paths_match({})
+        self.assertLess(stricter[:, 3].sum(), baseline[:, 3].sum())
+
+if __name__ == '__main__':
+    unittest.main()
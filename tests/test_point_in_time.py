@@ -5,33 +5,39 @@ Unit Tests: Point-in-Time Data Selection
 These tests verify that the prediction system does NOT use
 data from the same day or future dates (data leakage prevention).
 """
-import sys
+import sqlite3
+import tempfile
 from pathlib import Path
 from datetime import date, timedelta
 import unittest
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 from prediction_api import (
     _get_team_data_for_date,
     _get_available_table_dates,
+    _resolve_table_for_date,
     clear_team_data_cache,
     DataLeakageError,
     TEAM_DB_PATH
 )
+from src.BankrollEngine.service import BankrollService
+from src.Services.singletons import reset_singletons
 
 
 class TestPointInTimeDataSelection(unittest.TestCase):
     """Test suite for point-in-time safe data selection."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Snapshot tables don't change during the run: list them once."""
+        cls._available = _get_available_table_dates()
+    
     def setUp(self):
         """Clear cache before each test."""
         clear_team_data_cache()
         
     def test_available_dates_returns_sorted_list(self):
         """_get_available_table_dates returns a sorted list of dates."""
-        dates = _get_available_table_dates()
+        dates = self._available
         
         self.assertIsInstance(dates, list)
         self.assertGreater(len(dates), 0, "Should have at least some date tables")
@@ -42,7 +48,7 @@ class TestPointInTimeDataSelection(unittest.TestCase):
     
     def test_data_is_strictly_before_target_date(self):
         """Data returned must have date STRICTLY LESS THAN target_date."""
-        available = _get_available_table_dates()
+        available = self._available
         if len(available) < 2:
             self.skipTest("Need at least 2 snapshots to test")
         
@@ -61,7 +67,7 @@ class TestPointInTimeDataSelection(unittest.TestCase):
     
     def test_same_day_data_not_used(self):
         """CRITICAL: Data from the same day as the game must NOT be used."""
-        available = _get_available_table_dates()
+        available = self._available
         
         # Use the latest available date as target (simulating a game on that day)
         target_date = available[-1]
@@ -81,7 +87,7 @@ class TestPointInTimeDataSelection(unittest.TestCase):
     
     def test_future_data_not_used(self):
         """CRITICAL: Future data must never be accessible."""
-        available = _get_available_table_dates()
+        available = self._available
         
         # Pick an earlier date and verify we can't get future data
         target_date = available[0]  # Earliest date
@@ -105,7 +111,7 @@ class TestPointInTimeDataSelection(unittest.TestCase):
     
     def test_oldest_valid_snapshot_used(self):
         """When multiple valid snapshots exist, use the most recent one < target."""
-        available = _get_available_table_dates()
+        available = self._available
         if len(available) < 5:
             self.skipTest("Need at least 5 snapshots for this test")
         
@@ -128,7 +134,7 @@ class TestPointInTimeDataSelection(unittest.TestCase):
     
     def test_leakage_error_when_no_prior_data(self):
         """DataLeakageError raised when no data exists before target."""
-        available = _get_available_table_dates()
+        available = self._available
         earliest = available[0]
         
         # Try to get data for the earliest date - there should be nothing before it
@@ -139,7 +145,7 @@ class TestPointInTimeDataSelection(unittest.TestCase):
     
     def test_cache_respects_target_date(self):
         """Cache should not return stale data for different target dates."""
-        available = _get_available_table_dates()
+        available = self._available
         if len(available) < 3:
             self.skipTest("Need at least 3 snapshots")
         
@@ -157,9 +163,61 @@ class TestPointInTimeDataSelection(unittest.TestCase):
         print(f"✓ Cache correctly handles: target1={target1}->snap1={snap1}, target2={target2}->snap2={snap2}")
 
 
+class TestSnapshotIndexLookup(unittest.TestCase):
+    """The snapshot_index fast path must pick the same snapshot as the table scan."""
+    
+    def setUp(self):
+        clear_team_data_cache()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db_path = Path(tmp.name) / "TeamData.sqlite"
+        with sqlite3.connect(self.db_path) as con:
+            con.execute("CREATE TABLE snapshot_index (snapshot_date TEXT PRIMARY KEY, table_name TEXT NOT NULL)")
+            for name in ("2024-01-01", "2024-01-03", "2024-01-05"):
+                con.execute(f'CREATE TABLE "{name}" (TEAM_NAME TEXT)')
+                con.execute("INSERT INTO snapshot_index VALUES (?, ?)", (name, name))
+        self.addCleanup(clear_team_data_cache)
+    
+    def test_newest_snapshot_strictly_before_target(self):
+        self.assertEqual(_resolve_table_for_date(date(2024, 1, 5), self.db_path), ("2024-01-03", date(2024, 1, 3)))
+        clear_team_data_cache()
+        self.assertEqual(_resolve_table_for_date(date(2024, 2, 1), self.db_path), ("2024-01-05", date(2024, 1, 5)))
+    
+    def test_leakage_error_before_first_snapshot(self):
+        with self.assertRaises(DataLeakageError):
+            _resolve_table_for_date(date(2024, 1, 1), self.db_path)
+    
+    def test_index_matches_table_scan(self):
+        targets = [date(2024, 1, 2), date(2024, 1, 4), date(2024, 1, 5), date(2024, 1, 6), date(2024, 2, 1)]
+        
+        def resolve_all():
+            resolved = []
+            for target in targets:
+                clear_team_data_cache()
+                resolved.append(_resolve_table_for_date(target, self.db_path))
+            return resolved
+        
+        indexed = resolve_all()
+        # Without snapshot_index the resolver falls back to scanning sqlite_master
+        con = sqlite3.connect(self.db_path)
+        con.execute("DROP TABLE snapshot_index")
+        con.close()
+        self.assertEqual(resolve_all(), indexed)
+
+
 class TestPredictGameIntegration(unittest.TestCase):
     """Integration tests for predict_game with point-in-time safety."""
     
+    @classmethod
+    def setUpClass(cls):
+        cls._available = _get_available_table_dates()
+        # predict_game logs shadow bets; keep them out of Data/Bankroll.sqlite
+        BankrollService.reset_for_testing(":memory:")
+    
+    @classmethod
+    def tearDownClass(cls):
+        reset_singletons()
+    
     def setUp(self):
         clear_team_data_cache()
     
@@ -167,7 +225,7 @@ class TestPredictGameIntegration(unittest.TestCase):
         """predict_game should return the data_snapshot_date in the response."""
         from prediction_api import predict_game
         
-        available = _get_available_table_dates()
+        available = self._available
         target = available[-1]  # Use latest date as game date
         
         result = predict_game(
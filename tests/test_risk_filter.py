@@ -1,10 +1,6 @@
 import unittest
-import sys
-from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
-from src.RiskFilter.filter import RiskFilter, SeasonPhase, RiskDecision
+from src.RiskFilter.filter import RiskFilter, SeasonPhase, RiskDecision, RiskReason
 
 class TestRiskFilter(unittest.TestCase):
     
@@ -26,38 +22,38 @@ class TestRiskFilter(unittest.TestCase):
         # 52% prob (dead zone) -> BLOCKED
         result = self.filter.validate(0.52, 0.10)
         self.assertFalse(result.allowed)
-        self.assertIn("dead zone", result.reasons[0].lower())
+        self.assertIn(RiskReason.DEAD_ZONE, result.codes)
 
     def test_blocked_low_probability(self):
         # 40% prob -> BLOCKED
         result = self.filter.validate(0.40, 0.10)
         self.assertFalse(result.allowed)
-        self.assertTrue(any("probability" in r.lower() for r in result.reasons))
+        self.assertIn(RiskReason.LOW_PROB, result.codes)
 
     def test_blocked_low_ev(self):
         # 60% prob, 1% EV -> BLOCKED
         result = self.filter.validate(0.60, 0.01)
         self.assertFalse(result.allowed)
-        self.assertTrue(any("ev" in r.lower() for r in result.reasons))
+        self.assertIn(RiskReason.LOW_EV, result.codes)
 
     def test_blocked_negative_ev(self):
         # 60% prob, -5% EV -> BLOCKED
         result = self.filter.validate(0.60, -0.05)
         self.assertFalse(result.allowed)
-        self.assertTrue(any("negative" in r.lower() for r in result.reasons))
+        self.assertIn(RiskReason.NEGATIVE_EV, result.codes)
 
     def test_blocked_early_season(self):
         # 60% prob, 5% EV, early season -> BLOCKED
         result = self.filter.validate(0.60, 0.05, SeasonPhase.EARLY)
         self.assertFalse(result.allowed)
-        self.assertTrue(any("early season" in r.lower() for r in result.reasons))
+        self.assertIn(RiskReason.EARLY_SEASON, result.codes)
 
     def test_reduced_pre_deadline(self):
         # 60% prob, 5% EV, pre deadline -> ALLOWED but reduced
         result = self.filter.validate(0.60, 0.05, SeasonPhase.PRE_DEADLINE)
         self.assertTrue(result.allowed)
         self.assertEqual(result.aggressiveness, 0.5)
-        self.assertTrue(any("pre-trade" in r.lower() for r in result.reasons))
+        self.assertIn(RiskReason.PRE_DEADLINE, result.codes)
 
     def test_late_season_full_aggression(self):
         # 60% prob, 5% EV, late season -> ALLOWED full aggression
@@ -65,5 +61,24 @@ class TestRiskFilter(unittest.TestCase):
         self.assertTrue(result.allowed)
         self.assertEqual(result.aggressiveness, 1.0)
 
+    def test_verbose_reason_has_values(self):
+        # Verbose mode formats the blocking reason with the actual numbers
+        result = self.filter.validate(0.40, 0.10, verbose=True)
+        self.assertFalse(result.allowed)
+        self.assertIn("40.0%", result.reasons[0])
+        self.assertEqual(result.codes, (RiskReason.LOW_PROB,))
+
+    def test_verbose_reports_every_failure(self):
+        # Negative EV, dead zone and below min probability, in rule order
+        result = self.filter.validate(0.52, -0.05, SeasonPhase.EARLY, verbose=True)
+        self.assertFalse(result.allowed)
+        self.assertEqual(
+            result.codes,
+            (RiskReason.NEGATIVE_EV, RiskReason.DEAD_ZONE, RiskReason.LOW_PROB, RiskReason.EARLY_SEASON),
+        )
+        self.assertEqual(len(result.reasons), 4)
+        # First code matches the fast path's early return
+        self.assertEqual(self.filter.validate(0.52, -0.05, SeasonPhase.EARLY).codes[0], result.codes[0])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.RiskFilter.filter import RiskReason
+from src.Services.risk_guard import RiskGuard
+
+EARLY_SEASON_DATE = datetime(2025, 10, 15)
+MID_SEASON_DATE = datetime(2026, 1, 15)
+PRE_DEADLINE_DATE = datetime(2026, 2, 10)
+LATE_SEASON_DATE = datetime(2026, 3, 20)
+
+class TestRiskGuard(unittest.TestCase):
+    def setUp(self):
+        # Stub bankroll: only operational_status is read
+        self.bankroll = SimpleNamespace(operational_status="ACTIVE")
+        with patch("src.Services.risk_guard.get_bankroll_service", return_value=self.bankroll):
+            self.guard = RiskGuard()
+
+    def test_validate_bets_matches_validate_bet(self):
+        # Every hard rule and filter outcome, while active, degraded and paused
+        candidates = [
+            (0.70, 0.10, EARLY_SEASON_DATE),
+            (0.70, 0.10, MID_SEASON_DATE),
+            (0.70, 0.10, PRE_DEADLINE_DATE),
+            (0.70, 0.10, LATE_SEASON_DATE),
+            (0.52, 0.10, MID_SEASON_DATE),
+            (0.40, 0.10, MID_SEASON_DATE),
+            (0.70, 0.01, MID_SEASON_DATE),
+            (0.70, -0.05, PRE_DEADLINE_DATE),
+        ]
+        probs, evs, dates = zip(*candidates)
+        for status in ("ACTIVE", "DEGRADED", "PAUSED"):
+            with self.subTest(status=status):
+                self.bankroll.operational_status = status
+                allowed, codes, aggressiveness = self.guard.validate_bets(probs, evs, dates)
+                scalar = [self.guard.validate_bet(*c) for c in candidates]
+                self.assertEqual(allowed.tolist(), [d.allowed for d in scalar])
+                self.assertEqual(aggressiveness.tolist(), [d.aggressiveness for d in scalar])
+                self.assertEqual(codes.tolist(), [d.codes[0] if d.codes else 0 for d in scalar])
+
+    def test_paused_checked_before_season(self):
+        self.bankroll.operational_status = "PAUSED"
+        decision = self.guard.validate_bet(0.70, 0.10, EARLY_SEASON_DATE)
+        self.assertEqual(decision.codes, (RiskReason.CIRCUIT_BREAKER,))
+
+    def test_thorough_collects_every_failure_once(self):
+        self.bankroll.operational_status = "PAUSED"
+        decision = self.guard.validate_bet(0.52, 0.01, EARLY_SEASON_DATE, thorough=True)
+        self.assertFalse(decision.allowed)
+        self.assertEqual(
+            decision.codes,
+            (RiskReason.CIRCUIT_BREAKER, RiskReason.EARLY_SEASON, RiskReason.DEAD_ZONE,
+             RiskReason.LOW_PROB, RiskReason.LOW_EV),
+        )
+        self.assertEqual(len(decision.reasons), len(decision.codes))
+
+    def test_thorough_early_season_reported_once(self):
+        decision = self.guard.validate_bet(0.70, 0.10, EARLY_SEASON_DATE, thorough=True)
+        self.assertEqual(decision.codes, (RiskReason.EARLY_SEASON,))
+
+if __name__ == '__main__':
+    unittest.main()
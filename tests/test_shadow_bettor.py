@@ -0,0 +1,56 @@
+import unittest
+import threading
+from datetime import datetime
+
+from src.BankrollEngine.service import BankrollService
+from src.Services.shadow_bettor import ShadowBettor
+from src.Services.singletons import reset_singletons
+
+MID_SEASON_DATE = datetime(2026, 1, 15)
+
+class TestShadowBettor(unittest.TestCase):
+    def setUp(self):
+        self.svc = BankrollService.reset_for_testing(":memory:")
+        self.bettor = ShadowBettor()
+
+    def tearDown(self):
+        self.bettor.close()
+        reset_singletons()
+
+    def _logged(self):
+        with self.svc.connect() as con:
+            return sorted(r[0] for r in con.execute("SELECT game_id FROM shadow_bets"))
+
+    def test_logs_from_several_threads(self):
+        # The first write opens the shared connection on the main thread
+        self.bettor.process_game("GAME_0", 0.60, 2.00, MID_SEASON_DATE)
+        threads = [
+            threading.Thread(target=self.bettor.process_game, args=(f"GAME_{i}", 0.60, 2.00, MID_SEASON_DATE))
+            for i in range(1, 5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(self._logged(), [f"GAME_{i}" for i in range(5)])
+
+    def test_concurrent_batches_keep_their_rows(self):
+        batches = [
+            [(f"GAME_{t}_{i}", 0.60, 2.00, MID_SEASON_DATE) for i in range(20)]
+            for t in range(4)
+        ]
+        threads = [threading.Thread(target=self.bettor.process_games, args=(b,)) for b in batches]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(self._logged(), sorted(game[0] for b in batches for game in b))
+
+    def test_close_reopens_on_next_write(self):
+        self.bettor.process_game("GAME_0", 0.60, 2.00, MID_SEASON_DATE)
+        self.bettor.close()
+        self.bettor.process_games([("GAME_1", 0.60, 2.00, MID_SEASON_DATE)])
+        self.assertEqual(self._logged(), ["GAME_0", "GAME_1"])
+
+if __name__ == '__main__':
+    unittest.main()
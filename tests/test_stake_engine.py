@@ -1,35 +1,49 @@
 import unittest
-import sys
-from pathlib import Path
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+import numpy as np
 
-from src.StakeEngine.calculator import calculate_stake, calculate_kelly, StakeResult
+from src.StakeEngine.calculator import calculate_stake, calculate_kelly, calculate_kelly_batch, StakeResult
+
+# (probability, odds, raw kelly); f* = (p * odds - 1) / (odds - 1)
+KELLY_CASES = [
+    (0.60, 2.0, 0.20),   # positive edge: 0.2 / 1
+    (0.50, 2.0, 0.0),    # no edge
+    (0.40, 2.0, -0.20),  # negative edge
+]
+
+# (probability, odds, bankroll, calculate_stake kwargs, expected stake)
+STAKE_CASES = [
+    # kelly = 0.20, fractional = 0.05, stake = 100 * 0.05
+    (0.60, 2.0, 100.0, {"fractional_kelly": 0.25}, 5.0),
+    # Base stake = 5.0, halved by aggressiveness
+    (0.60, 2.0, 100.0, {"fractional_kelly": 0.25, "aggressiveness": 0.5}, 2.5),
+    # After a 50% drawdown: stakes scale with bankroll
+    (0.60, 2.0, 50.0, {"fractional_kelly": 0.25}, 2.5),
+]
 
 class TestKellyCalculator(unittest.TestCase):
     
-    def test_raw_kelly_positive_edge(self):
-        # 60% prob, 2.0 odds => f* = (0.6*2 - 1) / (2 - 1) = 0.2 / 1 = 0.2
-        kelly = calculate_kelly(0.60, 2.0)
-        self.assertAlmostEqual(kelly, 0.20, places=4)
-
-    def test_raw_kelly_no_edge(self):
-        # 50% prob, 2.0 odds => f* = (0.5*2 - 1) / (2 - 1) = 0 / 1 = 0
-        kelly = calculate_kelly(0.50, 2.0)
-        self.assertAlmostEqual(kelly, 0.0, places=4)
-
-    def test_raw_kelly_negative_edge(self):
-        # 40% prob, 2.0 odds => f* = (0.4*2 - 1) / (2 - 1) = -0.2
-        kelly = calculate_kelly(0.40, 2.0)
-        self.assertAlmostEqual(kelly, -0.20, places=4)
-
-    def test_stake_with_fractional_kelly(self):
-        # 60% prob, 2.0 odds, 100 bankroll, 0.25 fractional
-        # kelly = 0.20, fractional = 0.05, stake = 100 * 0.05 = 5.0
-        result = calculate_stake(0.60, 2.0, bankroll=100.0, fractional_kelly=0.25)
-        self.assertEqual(result.recommended_stake, 5.0)
-        self.assertAlmostEqual(result.stake_percent, 0.05, places=4)
-        self.assertFalse(result.was_capped)
+    def test_raw_kelly(self):
+        for probability, odds, expected in KELLY_CASES:
+            with self.subTest(probability=probability, odds=odds):
+                self.assertAlmostEqual(calculate_kelly(probability, odds), expected, places=4)
+
+    def test_kelly_batch_matches_scalar(self):
+        rng = np.random.default_rng(0)
+        probabilities = rng.uniform(0.0, 1.0, 10_000)
+        odds = rng.uniform(0.5, 10.0, 10_000)  # includes odds <= 1.0 (kelly 0)
+        np.testing.assert_allclose(
+            calculate_kelly_batch(probabilities, odds),
+            [calculate_kelly(p, o) for p, o in zip(probabilities, odds)],
+        )
+
+    def test_stake_cases(self):
+        for probability, odds, bankroll, kwargs, expected in STAKE_CASES:
+            with self.subTest(probability=probability, bankroll=bankroll, **kwargs):
+                result = calculate_stake(probability, odds, bankroll=bankroll, **kwargs)
+                self.assertAlmostEqual(result.recommended_stake, expected, places=4)
+                self.assertAlmostEqual(result.stake_percent, expected / bankroll, places=4)
+                self.assertFalse(result.was_capped)
 
     def test_stake_capped(self):
         # 80% prob, 2.0 odds, 100 bankroll
@@ -37,7 +51,7 @@ class TestKellyCalculator(unittest.TestCase):
         # fractional = 0.6 * 0.25 = 0.15 (15%)
         # But max is 5%, so capped
         result = calculate_stake(0.80, 2.0, bankroll=100.0, fractional_kelly=0.25, max_stake_percent=0.05)
-        self.assertEqual(result.recommended_stake, 5.0)  # Capped at 5%
+        self.assertAlmostEqual(result.recommended_stake, 5.0, places=4)  # Capped at 5%
         self.assertTrue(result.was_capped)
 
     def test_stake_negative_kelly_zeroed(self):
@@ -46,17 +60,5 @@ class TestKellyCalculator(unittest.TestCase):
         self.assertEqual(result.recommended_stake, 0.0)
         self.assertTrue(result.was_zeroed)
 
-    def test_aggressiveness_modifier(self):
-        # 60% prob, 2.0 odds, 100 bankroll, aggressiveness = 0.5
-        # Base stake = 5.0, adjusted = 2.5
-        result = calculate_stake(0.60, 2.0, bankroll=100.0, fractional_kelly=0.25, aggressiveness=0.5)
-        self.assertEqual(result.recommended_stake, 2.5)
-
-    def test_drawdown_scenario(self):
-        # Simulate bankroll after losses
-        # 60% prob, 2.0 odds, 50 bankroll (after 50% drawdown)
-        result = calculate_stake(0.60, 2.0, bankroll=50.0, fractional_kelly=0.25)
-        self.assertEqual(result.recommended_stake, 2.5)  # Stakes scale with bankroll
-
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,30 @@
+"""
+Run the verify_*.py report scripts under pytest so their assertions gate
+the suite; each binds the bankroll singleton to a scratch DB.
+"""
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from src.Services.singletons import reset_singletons
+from tests import verify_bankroll_service, verify_bet_pipeline, verify_risk_guard
+
+class TestVerifyScripts(unittest.TestCase):
+    def tearDown(self):
+        reset_singletons()
+
+    def _run(self, verify):
+        with redirect_stdout(io.StringIO()):
+            verify()
+
+    def test_verify_bankroll_service(self):
+        self._run(verify_bankroll_service.verify)
+
+    def test_verify_risk_guard(self):
+        self._run(verify_risk_guard.verify_risk_guard)
+
+    def test_verify_bet_pipeline(self):
+        self._run(verify_bet_pipeline.verify_pipeline)
+
+if __name__ == '__main__':
+    unittest.main()
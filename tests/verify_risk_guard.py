@@ -6,69 +6,70 @@ Checks if Hard Rules are enforced:
 1. PAUSED Status -> BLOCK
 2. Early Season -> BLOCK
 3. Normal Season -> ALLOW (if valid)
+Run from the repo root: python -m tests.verify_risk_guard
+(python -m tests runs every verify script)
 """
-import sys
+import io
 import os
+import sys
+from contextlib import redirect_stdout
 from datetime import datetime
-from pathlib import Path
-
-# Fix paths
-sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+from src.RiskFilter.filter import RiskReason
 from src.Services.risk_guard import get_risk_guard
-from src.BankrollEngine.service import get_bankroll_service
+from src.BankrollEngine.service import BankrollService
+
+# Game dates used throughout, built once
+EARLY_SEASON_DATE = datetime(2025, 10, 15)  # Oct 15: Early Season (banned)
+MID_SEASON_DATE = datetime(2026, 1, 15)     # Jan 15: Mid Season
+
+# RG_VERBOSE=1 prints every step; otherwise only failures and the final banner
+VERBOSE = os.environ.get("RG_VERBOSE") == "1"
+
+def _check(ok: bool, what: str, detail=None):
+    """Stop with a failure message. Unlike assert, this survives python -O."""
+    if not ok:
+        raise SystemExit(f"FAILED: {what} ({detail!r})")
 
 def verify_risk_guard():
-    # Setup test DB
-    test_db = Path("Data/Test_RiskGuard.sqlite")
-    if test_db.exists():
-        os.remove(test_db)
-        
-    # Init Services
-    bs = get_bankroll_service()
-    bs.db_path = test_db
-    bs._initialized = False
-    bs.__init__(db_path=str(test_db))
+    # Init Services on a private in-memory DB: nothing touches the disk
+    bs = BankrollService.reset_for_testing(":memory:")
     
     rg = get_risk_guard()
     
-    print("\n[TEST 1] Early Season Block (Oct 15)")
+    if VERBOSE: print("\n[TEST 1] Early Season Block (Oct 15)")
     # Even with high prob/ev, should block
-    d1 = datetime(2025, 10, 15)
-    decision = rg.validate_bet(0.70, 0.10, d1)
-    print(f"Date: {d1.date()} | Allowed: {decision.allowed} | Reason: {decision.reasons}")
-    assert decision.allowed == False
-    assert "HARD RULE" in decision.reasons[0]
+    decision = rg.validate_bet(0.70, 0.10, EARLY_SEASON_DATE)
+    if VERBOSE: print(f"Date: {EARLY_SEASON_DATE.date()} | Allowed: {decision.allowed} | Reason: {decision.reasons}")
+    _check(not decision.allowed, "TEST 1 early season bet was allowed", decision)
+    _check(decision.codes[:1] == (RiskReason.EARLY_SEASON,), "TEST 1 expected the early season hard rule", decision)
     
-    print("\n[TEST 2] Mid Season Allow (Jan 15)")
-    d2 = datetime(2026, 1, 15)
-    decision = rg.validate_bet(0.70, 0.10, d2)
-    print(f"Date: {d2.date()} | Allowed: {decision.allowed}")
-    assert decision.allowed == True
+    if VERBOSE: print("\n[TEST 2] Mid Season Allow (Jan 15)")
+    decision = rg.validate_bet(0.70, 0.10, MID_SEASON_DATE)
+    if VERBOSE: print(f"Date: {MID_SEASON_DATE.date()} | Allowed: {decision.allowed}")
+    _check(decision.allowed, "TEST 2 mid season bet was blocked", decision)
     
-    print("\n[TEST 3] Circuit Breaker (Paused Bankroll)")
-    # Force pause bankroll
-    # Lose 10 times
-    for _ in range(10):
-        bs.update_bankroll("LOSS", 1.0)
-        
-    print(f"Bankroll Status: {bs.operational_status}")
-    assert bs.operational_status == "PAUSED"
+    if VERBOSE: print("\n[TEST 3] Circuit Breaker (Paused Bankroll)")
+    # Force pause bankroll (the 10-loss trigger itself is exercised by verify_bankroll_service)
+    bs.force_status("PAUSED")
+    
+    status = bs.operational_status
+    if VERBOSE: print(f"Bankroll Status: {status}")
+    _check(status == "PAUSED", "TEST 3 bankroll did not pause", status)
     
     # Try mid season bet again
-    decision = rg.validate_bet(0.70, 0.10, d2)
-    print(f"Date: {d2.date()} | Allowed: {decision.allowed} | Reason: {decision.reasons}")
-    assert decision.allowed == False
-    assert "CIRCUIT BREAKER" in decision.reasons[0]
+    decision = rg.validate_bet(0.70, 0.10, MID_SEASON_DATE)
+    if VERBOSE: print(f"Date: {MID_SEASON_DATE.date()} | Allowed: {decision.allowed} | Reason: {decision.reasons}")
+    _check(not decision.allowed, "TEST 3 bet allowed while paused", decision)
+    _check(decision.codes[:1] == (RiskReason.CIRCUIT_BREAKER,), "TEST 3 expected the circuit breaker", decision)
     
     print("\n✅ RiskGuard Verification Passed!")
-    
-    # Cleanup
-    if test_db.exists():
-        try:
-            os.remove(test_db)
-        except:
-            pass
 
 if __name__ == "__main__":
-    verify_risk_guard()
+    # Collect the report and write it to the console in one go
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            verify_risk_guard()
+    finally:
+        sys.__stdout__.write(buf.getvalue())